@@ -7,7 +7,7 @@ import random
 import pygame
 
 from localization import localize_role
-from world import TILE_SIZE
+from world import SOLID_TILES, TILE_SIZE
 
 
 class BuildingSystem:
@@ -23,7 +23,7 @@ class BuildingSystem:
 
     def can_place(self, world, tx: int, ty: int) -> bool:
         tile = world.get_tile(tx, ty)
-        if tile in {"water", "stone"}:
+        if tile in SOLID_TILES:
             return False
         if (tx, ty) in world.player_blocks:
             return False
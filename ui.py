@@ -13,6 +13,26 @@ from localization import (
     localize_skill,
     localize_weather,
 )
+from utils import blit_batch, to_display_format
+
+MINIMAP_BIOME_COLORS = {
+    "plains": (80, 200, 90),
+    "forest": (50, 150, 65),
+    "mountains": (130, 130, 140),
+}
+MINIMAP_DEFAULT_COLOR = (130, 85, 150)
+NOTIFICATION_FADE_STEPS = 16
+
+
+def _fade_step(notification: dict) -> int:
+    fade = notification["ttl"] / notification["max"]
+    return max(0, min(NOTIFICATION_FADE_STEPS - 1, int(fade * (NOTIFICATION_FADE_STEPS - 1) + 0.5)))
+
+
+def _solid_tile(color: tuple[int, int, int], size: int = 3) -> pygame.Surface:
+    tile = pygame.Surface((size, size))
+    tile.fill(color)
+    return to_display_format(tile)
 
 
 class UIManager:
@@ -23,18 +43,37 @@ class UIManager:
         self.show_event_panel = True
         self.show_progression = False
         self.notifications: list[dict] = []
+        self._biome_tiles = {name: _solid_tile(col) for name, col in MINIMAP_BIOME_COLORS.items()}
+        self._default_biome_tile = _solid_tile(MINIMAP_DEFAULT_COLOR)
+        self._notif_strip: pygame.Surface | None = None
+        # Labels go straight onto the screen after the strip, at offsets from the strip's top-left.
+        self._notif_labels: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        self._notif_font: pygame.font.Font | None = None
+        self._notif_dirty = True
+        self._pause_size: tuple[int, int] | None = None
+        self._pause_surf: pygame.Surface | None = None
+        self._pause_text: tuple[pygame.font.Font, pygame.Surface] | None = None
 
     def notify(self, text: str, color: tuple[int, int, int] = (255, 230, 255), ttl: float = 4.0) -> None:
-        self.notifications.append({"text": text, "ttl": ttl, "max": ttl, "color": color})
+        self.notifications.append({"text": text, "ttl": ttl, "max": ttl, "color": color, "step": NOTIFICATION_FADE_STEPS - 1})
         self.notifications = self.notifications[-8:]
+        self._notif_dirty = True
 
     def update(self, dt: float) -> None:
-        alive = []
-        for n in self.notifications:
+        notifications = self.notifications
+        write = 0
+        for n in notifications:
             n["ttl"] -= dt
             if n["ttl"] > 0:
-                alive.append(n)
-        self.notifications = alive
+                step = _fade_step(n)
+                if step != n["step"]:
+                    n["step"] = step
+                    self._notif_dirty = True
+                notifications[write] = n
+                write += 1
+        if write != len(notifications):
+            self._notif_dirty = True
+        del notifications[write:]
 
     def draw_bars(self, surface: pygame.Surface, player, font: pygame.font.Font) -> None:
         # Background with gradient
@@ -93,33 +132,50 @@ class UIManager:
 
         cx = int(player.x // 32)
         cy = int(player.y // 32)
+        tiles = self._biome_tiles
+        default_tile = self._default_biome_tile
+        seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
         for oy in range(-20, 21):
             for ox in range(-20, 21):
                 tx = cx + ox
                 ty = cy + oy
-                if (tx, ty) not in world.discovered_tiles:
+                if not world.is_discovered(tx, ty):
                     continue
                 px = mini.centerx + ox * 3
                 py = mini.centery + oy * 3
-                biome = world.biome_at(tx, ty)
-                col = (80, 200, 90) if biome == "plains" else (50, 150, 65) if biome == "forest" else (130, 130, 140) if biome == "mountains" else (130, 85, 150)
-                pygame.draw.rect(surface, col, (px, py, 3, 3))
+                seq.append((tiles.get(world.biome_at(tx, ty), default_tile), (px, py)))
+        blit_batch(surface, seq)
 
         pygame.draw.circle(surface, (255, 220, 130), mini.center, 3)
         surface.blit(font.render(localize_weather(world.weather), True, (220, 220, 245)), (mini.x + 8, mini.bottom - 20))
 
+    def _compose_notifications(
+        self, font: pygame.font.Font
+    ) -> tuple[pygame.Surface, list[tuple[pygame.Surface, tuple[int, int]]]]:
+        labels = [(n, font.render(n["text"][:72], True, n["color"])) for n in reversed(self.notifications)]
+        strip_w = max(label.get_width() for _, label in labels) + 18
+        strip = pygame.Surface((strip_w, (len(labels) - 1) * 28 + 24), pygame.SRCALPHA)
+        placed: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for i, (n, label) in enumerate(labels):
+            box_w = label.get_width() + 18
+            x = strip_w - box_w
+            y = i * 28
+            strip.fill((40, 30, 70, int(170 * n["step"] / (NOTIFICATION_FADE_STEPS - 1))), (x, y, box_w, 24))
+            # Text is kept off the translucent strip: blending it in twice would soften its antialiased edges.
+            placed.append((label, (x + 9, y + 4)))
+        return to_display_format(strip), placed
+
     def draw_notifications(self, surface: pygame.Surface, font: pygame.font.Font, screen_w: int) -> None:
-        base_y = 178
-        for i, n in enumerate(reversed(self.notifications)):
-            fade = n["ttl"] / n["max"]
-            txt = n["text"]
-            label = font.render(txt[:72], True, n["color"])
-            box = pygame.Surface((label.get_width() + 18, 24), pygame.SRCALPHA)
-            box.fill((40, 30, 70, int(170 * fade)))
-            x = screen_w - box.get_width() - 12
-            y = base_y + i * 28
-            surface.blit(box, (x, y))
-            surface.blit(label, (x + 9, y + 4))
+        if not self.notifications:
+            return
+        if self._notif_dirty or self._notif_strip is None or self._notif_font is not font:
+            self._notif_strip, self._notif_labels = self._compose_notifications(font)
+            self._notif_font = font
+            self._notif_dirty = False
+        x = screen_w - self._notif_strip.get_width() - 12
+        y = 178
+        surface.blit(self._notif_strip, (x, y))
+        blit_batch(surface, [(label, (x + dx, y + dy)) for label, (dx, dy) in self._notif_labels])
 
     def draw_event_panel(self, surface: pygame.Surface, font: pygame.font.Font, events_system, y: int = 82) -> None:
         if not self.show_event_panel:
@@ -140,10 +196,15 @@ class UIManager:
     def draw_pause_overlay(self, surface: pygame.Surface, font_big: pygame.font.Font, screen_w: int, screen_h: int) -> None:
         if not self.paused:
             return
-        overlay = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA)
-        overlay.fill((16, 12, 24, 170))
-        surface.blit(overlay, (0, 0))
-        txt = font_big.render("ПАУЗА", True, (250, 240, 255))
+        if self._pause_surf is None or self._pause_size != (screen_w, screen_h):
+            overlay = pygame.Surface((screen_w, screen_h), pygame.SRCALPHA)
+            overlay.fill((16, 12, 24, 170))
+            self._pause_surf = to_display_format(overlay)
+            self._pause_size = (screen_w, screen_h)
+        surface.blit(self._pause_surf, (0, 0))
+        if self._pause_text is None or self._pause_text[0] is not font_big:
+            self._pause_text = (font_big, font_big.render("ПАУЗА", True, (250, 240, 255)))
+        txt = self._pause_text[1]
         surface.blit(txt, (screen_w // 2 - txt.get_width() // 2, screen_h // 2 - 30))
 
     def draw_progression_panel(self, surface: pygame.Surface, font: pygame.font.Font, progression, x: int = 20, y: int = 100) -> None:
@@ -11,15 +11,41 @@ from typing import Any
 
 import pygame
 
+_HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
 
 def clamp(value: float, vmin: float, vmax: float) -> float:
-    return max(vmin, min(value, vmax))
+    # Conditional expression avoids two builtin calls in per-frame loops.
+    return vmin if value < vmin else vmax if value > vmax else value
 
 
 def aabb_collision(a: pygame.Rect, b: pygame.Rect) -> bool:
     return a.colliderect(b)
 
 
+def to_display_format(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a cached surface to the display pixel format so blits take SDL's fast path."""
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def blit_batch(
+    surface: pygame.Surface,
+    seq: list[tuple[pygame.Surface, tuple[int, int]]],
+    special_flags: int = 0,
+) -> None:
+    """Blit many (source, dest) pairs in one call; uses fblits on pygame-ce."""
+    if _HAS_FBLITS:
+        surface.fblits(seq, special_flags)
+    elif special_flags:
+        surface.blits([(src, dest, None, special_flags) for src, dest in seq], doreturn=False)
+    else:
+        surface.blits(seq, doreturn=False)
+
+
 @dataclass
 class Camera:
     width: int
@@ -28,17 +54,30 @@ class Camera:
     y: float = 0
 
     def update(self, target_x: float, target_y: float, smoothing: float = 0.12) -> None:
-        self.x += (target_x - self.width // 2 - self.x) * smoothing
-        self.y += (target_y - self.height // 2 - self.y) * smoothing
+        x = self.x
+        y = self.y
+        self.x = x + (target_x - (self.width >> 1) - x) * smoothing
+        self.y = y + (target_y - (self.height >> 1) - y) * smoothing
 
     def world_to_screen(self, wx: float, wy: float) -> tuple[int, int]:
         return int(wx - self.x), int(wy - self.y)
 
+    def snapshot(self) -> tuple[int, int]:
+        """Integer camera offset; read once per frame outside tight loops."""
+        return int(self.x), int(self.y)
+
     def apply_rect(self, rect: pygame.Rect) -> pygame.Rect:
-        return pygame.Rect(rect.x - int(self.x), rect.y - int(self.y), rect.width, rect.height)
+        ix, iy = self.snapshot()
+        return pygame.Rect(rect.x - ix, rect.y - iy, rect.width, rect.height)
 
+    def apply_rect_into(self, rect: pygame.Rect, out: pygame.Rect, offset: tuple[int, int] | None = None) -> pygame.Rect:
+        """Allocation-free apply_rect: writes the screen-space rect into ``out``."""
+        ix, iy = offset if offset is not None else self.snapshot()
+        out.update(rect.x - ix, rect.y - iy, rect.width, rect.height)
+        return out
 
-@dataclass
+
+@dataclass(slots=True, eq=False)
 class Particle:
     x: float
     y: float
@@ -51,15 +90,18 @@ class Particle:
     gravity: float = 0.0
 
     def update(self, dt: float) -> bool:
-        self.life -= dt
-        self.vy += self.gravity * dt
+        life = self.life - dt
+        vy = self.vy + self.gravity * dt
+        self.life = life
+        self.vy = vy
         self.x += self.vx * dt
-        self.y += self.vy * dt
-        return self.life > 0
+        self.y += vy * dt
+        return life > 0
 
     def draw(self, surface: pygame.Surface, camera: Camera) -> None:
-        alpha = int(255 * max(0.0, self.life / self.max_life))
-        radius = max(1, int(self.size * (0.3 + 0.7 * self.life / self.max_life)))
+        ratio = self.life / self.max_life
+        alpha = int(255 * ratio) if ratio > 0.0 else 0
+        radius = max(1, int(self.size * (0.3 + 0.7 * ratio)))
         sx, sy = camera.world_to_screen(self.x, self.y)
         p_surf = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
         pygame.draw.circle(p_surf, (*self.color, alpha), (radius, radius), radius)
@@ -100,7 +142,13 @@ class ParticleSystem:
             )
 
     def update(self, dt: float) -> None:
-        self.particles = [p for p in self.particles if p.update(dt)]
+        particles = self.particles
+        write = 0
+        for particle in particles:
+            if particle.update(dt):
+                particles[write] = particle
+                write += 1
+        del particles[write:]
 
     def draw(self, surface: pygame.Surface, camera: Camera) -> None:
         for particle in self.particles:
@@ -109,7 +157,8 @@ class ParticleSystem:
 
 def save_json(path: str | Path, data: dict[str, Any]) -> None:
     target = Path(path)
-    target.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Compact output keeps json on its C encoder; indent forces the pure-Python path.
+    target.write_text(json.dumps(data, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
 
 
 def load_json(path: str | Path) -> dict[str, Any] | None:
@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import math
 import random
+from bisect import bisect_right
 from dataclasses import dataclass
 
 import pygame
 
+from utils import blit_batch, to_display_format
+
 
 def lerp(a: float, b: float, t: float) -> float:
     return a + (b - a) * t
@@ -25,12 +28,113 @@ def _wrap_hour(value: float) -> float:
     return value % 24.0
 
 
+def smoothstep(t: float) -> float:
+    return t * t * (3.0 - 2.0 * t)
+
+
+def _interp(x: float, xs: tuple[float, ...], ys: tuple[float, ...]) -> float:
+    """Piecewise-linear interpolation over sorted ``xs``, clamped at both ends."""
+    i = bisect_right(xs, x) - 1
+    if i < 0:
+        return ys[0]
+    if i >= len(xs) - 1:
+        return ys[-1]
+    x0 = xs[i]
+    return ys[i] + (ys[i + 1] - ys[i]) * (x - x0) / (xs[i + 1] - x0)
+
+
+def _uniform_column(rng: random.Random, low: float, high: float, n: int) -> list[float]:
+    """``n`` samples from [low, high) in one comprehension over the C-level ``rng.random``."""
+    rand = rng.random
+    span = high - low
+    return [low + span * rand() for _ in range(n)]
+
+
+def _make_dot(radius: int, color: tuple[int, int, int, int], width: int = 0) -> pygame.Surface:
+    """A circle sprite centred at ``(radius, radius)``; ``width`` > 0 draws a ring."""
+    size = radius * 2 + 1
+    dot = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(dot, color, (radius, radius), radius, width)
+    return to_display_format(dot)
+
+
+# Night strength keyframes: full night until 4:00, fades out by 6:00, back in from 17:00 to 20:00.
+_NIGHT_HOURS = (0.0, 4.0, 6.0, 17.0, 20.0, 24.0)
+_NIGHT_LEVELS = (1.0, 1.0, 0.0, 0.0, 1.0, 1.0)
+
+
+_HAS_BOX_BLUR = hasattr(pygame.transform, "box_blur")
+
+SKY_LUT_STEPS = 24 * 60
+SKY_GRADIENT_CACHE_SIZE = 2
+SKY_NIGHT_EPSILON = 0.02
+SKY_NIGHT_BUCKETS = 8
+SKY_NEBULA_DRIFT_STEPS = 4
+SKY_NIGHT_CACHE_SIZE = 4
+STAR_TWINKLE_RATE = 1.6
+DAMAGE_LABEL_CACHE_SIZE = 256
+RAIN_TRAIL_LEN = 4
+RAIN_TRAIL_FPS = 60
+ARCANE_STREAK_MAX_LIFE = 0.7
+SPLASH_MAX_LIFE = 0.22
+RUNE_PARTICLE_MAX_LIFE = 0.9
+VIGNETTE_RES = 64
+SPRITE_ALPHA_STEP = 8
+
+# The rune circle loops over RUNE_CYCLE_STEPS cached frames (6 s at 20 steps/s). Angular
+# rates are snapped to whole symmetry periods per cycle so the loop point is seamless.
+RUNE_STEPS_PER_SECOND = 20
+RUNE_CYCLE_STEPS = 120
+_RUNE_CYCLE_SECONDS = RUNE_CYCLE_STEPS / RUNE_STEPS_PER_SECOND
+RUNE_PULSE_RATE = 2 * math.tau / _RUNE_CYCLE_SECONDS
+RUNE_SPOKE_RATE = 13 * (math.tau / 8) / _RUNE_CYCLE_SECONDS
+RUNE_ORBIT_RATE = 7 * (math.tau / 6) / _RUNE_CYCLE_SECONDS
+
+
+def _expire(cols: dict[str, list], dt: float) -> None:
+    """Age life and drop expired entries from every column."""
+    life = [v - dt for v in cols["life"]]
+    cols["life"] = life
+    if all(v > 0 for v in life):
+        return
+    keep = [i for i, v in enumerate(life) if v > 0]
+    for key, col in cols.items():
+        cols[key] = [col[i] for i in keep]
+
+
+def _integrate(cols: dict[str, list], dt: float) -> None:
+    """Advance x/y by velocity, then age and compact like _expire."""
+    cols["x"] = [x + vx * dt for x, vx in zip(cols["x"], cols["vx"])]
+    cols["y"] = [y + vy * dt for y, vy in zip(cols["y"], cols["vy"])]
+    _expire(cols, dt)
+
+
+# Precomputed shake offsets in [-127, 127]; indexed as a ring buffer by ScreenShake.
+# One seeded generator for the whole table; a fresh Random per element would repeat its first draw.
+_shake_rng = random.Random(0x5EED)
+_SHAKE_NOISE = tuple(_shake_rng.randint(-127, 127) for _ in range(512))
+assert len(set(_SHAKE_NOISE)) > 1, "shake noise table must not be constant"
+
+
 class SkyRenderer:
     def __init__(self, seed: int = 0) -> None:
         self.seed = seed
         self.rng = random.Random(seed)
-        self.stars = self._generate_stars()
+        self._generate_stars()
         self.nebulae = self._generate_nebulae()
+        keys = self._sky_keys()
+        self._key_t = [k[0] for k in keys]
+        self._key_top = [k[1] for k in keys]
+        self._key_bot = [k[2] for k in keys]
+        # One (top, bottom) gradient pair per in-game minute.
+        self._sky_lut = [self._gradient(i * 24.0 / SKY_LUT_STEPS) for i in range(SKY_LUT_STEPS)]
+        self._grad_cache: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._layer_size: tuple[int, int] | None = None
+        self._nebula_layer: pygame.Surface | None = None
+        self._star_layer: pygame.Surface | None = None
+        # (nebula, stars) per key; kept apart so the twinkle shimmer only touches the stars.
+        self._night_cache: dict[tuple[int, int, int, int], tuple[pygame.Surface, pygame.Surface]] = {}
+        self._haze_layer: tuple[pygame.Surface, int] | None = None
 
     def _phase(self, time_of_day: float) -> str:
         t = _wrap_hour(time_of_day)
@@ -55,29 +159,59 @@ class SkyRenderer:
 
     def _gradient(self, time_of_day: float) -> tuple[tuple[int, int, int], tuple[int, int, int]]:
         t = _wrap_hour(time_of_day)
-        keys = self._sky_keys()
-        for i in range(len(keys) - 1):
-            t0, top0, bot0 = keys[i]
-            t1, top1, bot1 = keys[i + 1]
-            if t0 <= t <= t1:
-                phase_t = (t - t0) / max(0.001, t1 - t0)
-                return color_lerp(top0, top1, phase_t), color_lerp(bot0, bot1, phase_t)
-        return keys[-1][1], keys[-1][2]
-
-    def _generate_stars(self) -> list[dict[str, float]]:
-        stars: list[dict[str, float]] = []
-        for _ in range(180):
-            stars.append(
-                {
-                    "x": self.rng.random(),
-                    "y": self.rng.random() * 0.72,
-                    "size": self.rng.choice([1.0, 1.0, 1.0, 1.5, 2.0]),
-                    "twinkle": self.rng.uniform(0.8, 2.4),
-                    "phase": self.rng.uniform(0.0, math.tau),
-                    "base": self.rng.randint(165, 245),
-                }
-            )
-        return stars
+        key_t = self._key_t
+        i = min(max(0, bisect_right(key_t, t) - 1), len(key_t) - 2)
+        f = smoothstep((t - key_t[i]) / max(0.001, key_t[i + 1] - key_t[i]))
+        return (
+            color_lerp(self._key_top[i], self._key_top[i + 1], f),
+            color_lerp(self._key_bot[i], self._key_bot[i + 1], f),
+        )
+
+    def _build_gradient(
+        self, w: int, h: int, top: tuple[int, int, int], bottom: tuple[int, int, int]
+    ) -> pygame.Surface:
+        # One packed RGB column with the exact per-row colours, wrapped by SDL
+        # via frombuffer and stretched sideways; no per-row draw calls.
+        denom = max(1, h - 1)
+        column = bytes(channel for y in range(h) for channel in color_lerp(top, bottom, y / denom))
+        strip = pygame.image.frombuffer(column, (1, h), "RGB")
+        return pygame.transform.scale(strip, (w, h))
+
+    def _get_gradient_surface(self, w: int, h: int, time_of_day: float) -> pygame.Surface:
+        minute = int(_wrap_hour(time_of_day) * 60) % SKY_LUT_STEPS
+        key = (w, h, minute)
+        cached = self._grad_cache.get(key)
+        if cached is not None:
+            return cached
+        top, bottom = self._sky_lut[minute]
+        built = to_display_format(self._build_gradient(w, h, top, bottom))
+        # Time of day only moves forward, so only the newest gradients are ever reused;
+        # each entry is a full-screen surface, which keeps this cache tiny.
+        if len(self._grad_cache) >= SKY_GRADIENT_CACHE_SIZE:
+            # Dicts keep insertion order, so the first key is the oldest entry.
+            del self._grad_cache[next(iter(self._grad_cache))]
+        self._grad_cache[key] = built
+        return built
+
+    def _generate_stars(self, count: int = 180) -> None:
+        # Stars are stored as parallel columns so the draw loop avoids per-star dict lookups.
+        rng = self.rng
+        self.star_x = _uniform_column(rng, 0.0, 1.0, count)
+        self.star_y = _uniform_column(rng, 0.0, 0.72, count)
+        self.star_size = rng.choices([1.0, 1.0, 1.0, 1.5, 2.0], k=count)
+        self.star_base = rng.choices(range(165, 246), k=count)
+        self._star_screen: tuple[int, int, list[tuple[int, int, int]]] | None = None
+
+    def _star_positions(self, w: int, h: int) -> list[tuple[int, int, int]]:
+        cached = self._star_screen
+        if cached is None or cached[0] != w or cached[1] != h:
+            positions = [
+                (int(x * w), int(y * h), max(1, int(size)))
+                for x, y, size in zip(self.star_x, self.star_y, self.star_size)
+            ]
+            cached = (w, h, positions)
+            self._star_screen = cached
+        return cached[2]
 
     def _generate_nebulae(self) -> list[dict[str, float]]:
         blobs: list[dict[str, float]] = []
@@ -92,46 +226,77 @@ class SkyRenderer:
             )
         return blobs
 
+    def _ensure_layers(self, w: int, h: int) -> None:
+        # Overlay layers live as long as the resolution does; the haze never changes for a given size.
+        if self._layer_size == (w, h):
+            return
+        self._layer_size = (w, h)
+        self._nebula_layer = pygame.Surface((w, h), pygame.SRCALPHA)
+        self._star_layer = pygame.Surface((w, h), pygame.SRCALPHA)
+        bands = [(int(h * 0.08 + i * h * 0.035), 12 - i) for i in range(6)]
+        bands = [(band_h, alpha) for band_h, alpha in bands if band_h > 0 and alpha > 0]
+        # Only the bottom strip is ever tinted, so the haze surface covers just that strip.
+        if bands:
+            strip_h = max(band_h for band_h, _ in bands)
+            haze = pygame.Surface((w, strip_h), pygame.SRCALPHA)
+            for band_h, alpha in bands:
+                pygame.draw.rect(haze, (255, 210, 190, alpha), (0, strip_h - band_h, w, band_h))
+            self._haze_layer = (to_display_format(haze), h - strip_h)
+        else:
+            self._haze_layer = None
+
+    def _get_night_layers(
+        self, w: int, h: int, night: float, time_of_day: float
+    ) -> tuple[pygame.Surface, pygame.Surface]:
+        bucket = round(night * SKY_NIGHT_BUCKETS)
+        # The nebula drifts a few pixels per in-game hour, so sampling it per quarter hour is invisible.
+        drift_step = int(_wrap_hour(time_of_day) * SKY_NEBULA_DRIFT_STEPS)
+        key = (w, h, bucket, drift_step)
+        cached = self._night_cache.get(key)
+        if cached is not None:
+            return cached
+
+        level = bucket / SKY_NIGHT_BUCKETS
+        drift_time = drift_step / SKY_NEBULA_DRIFT_STEPS
+        nebula = self._nebula_layer
+        nebula.fill((0, 0, 0, 0))
+        alpha = int(42 * level)
+        for blob in self.nebulae:
+            cx = int(blob["x"] * w + math.sin(drift_time * 0.11 + blob["phase"]) * 22)
+            cy = int(blob["y"] * h)
+            radius = int(blob["r"] * min(w, h))
+            pygame.draw.circle(nebula, (115, 85, 190, alpha), (cx, cy), radius)
+            pygame.draw.circle(nebula, (85, 128, 220, alpha // 2), (cx + radius // 3, cy), radius // 2)
+
+        star_layer = self._star_layer
+        star_layer.fill((0, 0, 0, 0))
+        draw_circle = pygame.draw.circle
+        for (sx, sy, radius), base in zip(self._star_positions(w, h), self.star_base):
+            draw_circle(star_layer, (235, 235, 255, int(min(255, base * level))), (sx, sy), radius)
+
+        layers = (to_display_format(nebula.copy()), to_display_format(star_layer.copy()))
+        if len(self._night_cache) >= SKY_NIGHT_CACHE_SIZE:
+            del self._night_cache[next(iter(self._night_cache))]
+        self._night_cache[key] = layers
+        return layers
+
     def _night_strength(self, time_of_day: float) -> float:
-        t = _wrap_hour(time_of_day)
-        if 6 <= t < 17:
-            return 0.0
-        if 4 <= t < 6:
-            return (6 - t) / 2
-        if 17 <= t < 20:
-            return (t - 17) / 3
-        return 1.0
+        return _interp(_wrap_hour(time_of_day), _NIGHT_HOURS, _NIGHT_LEVELS)
 
     def draw(self, surface: pygame.Surface, time_of_day: float) -> None:
         w, h = surface.get_size()
         phase = self._phase(time_of_day)
-        top, bottom = self._gradient(time_of_day)
-        for y in range(h):
-            t = y / max(1, h - 1)
-            col = color_lerp(top, bottom, t)
-            pygame.draw.line(surface, col, (0, y), (w, y))
+        surface.blit(self._get_gradient_surface(w, h, time_of_day), (0, 0))
 
+        self._ensure_layers(w, h)
         night = self._night_strength(time_of_day)
-        if night > 0:
-            nebula = pygame.Surface((w, h), pygame.SRCALPHA)
-            for blob in self.nebulae:
-                cx = int(blob["x"] * w + math.sin(time_of_day * 0.11 + blob["phase"]) * 22)
-                cy = int(blob["y"] * h)
-                radius = int(blob["r"] * min(w, h))
-                alpha = int(42 * night)
-                pygame.draw.circle(nebula, (115, 85, 190, alpha), (cx, cy), radius)
-                pygame.draw.circle(nebula, (85, 128, 220, alpha // 2), (cx + radius // 3, cy), radius // 2)
+        if night >= SKY_NIGHT_EPSILON:
+            # Stars are baked at full twinkle; a single shared shimmer modulates the star layer only.
+            shimmer = 0.45 + 0.55 * math.sin(time_of_day * STAR_TWINKLE_RATE)
+            nebula, stars = self._get_night_layers(w, h, night, time_of_day)
             surface.blit(nebula, (0, 0))
-
-            star_layer = pygame.Surface((w, h), pygame.SRCALPHA)
-            for s in self.stars:
-                twinkle = 0.45 + 0.55 * math.sin(time_of_day * s["twinkle"] + s["phase"])
-                alpha = int(min(255, s["base"] * night * (0.65 + twinkle * 0.35)))
-                sx = int(s["x"] * w)
-                sy = int(s["y"] * h)
-                radius = int(s["size"])
-                pygame.draw.circle(star_layer, (235, 235, 255, alpha), (sx, sy), max(1, radius))
-            surface.blit(star_layer, (0, 0))
+            stars.set_alpha(int(255 * (0.65 + shimmer * 0.35)))
+            surface.blit(stars, (0, 0))
 
         # Sun/moon trajectory.
         angle = ((_wrap_hour(time_of_day) - 6.0) / 24.0) * math.tau
@@ -153,15 +318,12 @@ class SkyRenderer:
             pygame.draw.circle(surface, (255, 250, 210), (cx - 5, cy - 5), 7)
 
         # Subtle horizon haze for depth.
-        haze = pygame.Surface((w, h), pygame.SRCALPHA)
-        for i in range(6):
-            band_h = int(h * 0.08 + i * h * 0.035)
-            alpha = 12 - i
-            pygame.draw.rect(haze, (255, 210, 190, max(0, alpha)), (0, h - band_h, w, band_h))
-        surface.blit(haze, (0, 0))
+        if self._haze_layer is not None:
+            haze, haze_y = self._haze_layer
+            surface.blit(haze, (0, haze_y))
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class DamageNumber:
     x: float
     y: float
@@ -174,37 +336,56 @@ class DamageNumber:
 class DamageNumberSystem:
     def __init__(self) -> None:
         self.items: list[DamageNumber] = []
+        self._label_cache: dict[tuple[str, tuple[int, int, int]], pygame.Surface] = {}
+        self._label_font: pygame.font.Font | None = None
+
+    def _get_label(self, font: pygame.font.Font, text: str, color: tuple[int, int, int]) -> pygame.Surface:
+        if font is not self._label_font:
+            self._label_cache.clear()
+            self._label_font = font
+        key = (text, color)
+        label = self._label_cache.pop(key, None)
+        if label is None:
+            label = to_display_format(font.render(text, True, color))
+            if len(self._label_cache) >= DAMAGE_LABEL_CACHE_SIZE:
+                del self._label_cache[next(iter(self._label_cache))]
+        # Re-inserting keeps the dict ordered from least to most recently used.
+        self._label_cache[key] = label
+        return label
 
     def spawn(self, x: float, y: float, value: int, critical: bool = False) -> None:
         color = (255, 230, 120) if critical else (255, 170, 170)
         self.items.append(DamageNumber(x, y, str(value), color, life=1.2 if critical else 0.85))
 
     def update(self, dt: float) -> None:
-        alive = []
-        for n in self.items:
+        items = self.items
+        write = 0
+        gravity = 20 * dt
+        for n in items:
+            vy = n.vy
+            n.y += vy * dt
+            n.vy = vy - gravity
             n.life -= dt
-            n.y += n.vy * dt
-            n.vy -= 20 * dt
             if n.life > 0:
-                alive.append(n)
-        self.items = alive
+                items[write] = n
+                write += 1
+        del items[write:]
 
     def draw(self, surface: pygame.Surface, camera, font: pygame.font.Font) -> None:
+        seq: list[tuple[pygame.Surface, tuple[int, int]]] = []
         for n in self.items:
-            sx, sy = camera.world_to_screen(n.x, n.y)
             alpha = int(255 * min(1.0, n.life / 0.85))
-            label = font.render(n.text, True, n.color)
-            sprite = pygame.Surface((label.get_width(), label.get_height()), pygame.SRCALPHA)
-            sprite.blit(label, (0, 0))
+            sprite = self._get_label(font, n.text, n.color).copy()
             sprite.set_alpha(alpha)
-            surface.blit(sprite, (sx, sy))
+            seq.append((sprite, camera.world_to_screen(n.x, n.y)))
+        blit_batch(surface, seq)
 
 
 class WeatherRenderer:
     def __init__(self, seed: int = 0) -> None:
         self.rng = random.Random(seed)
         self.wind_phase = self.rng.uniform(0, math.tau)
-        self.clouds = [
+        self.clouds: list[dict] = [
             {
                 "x": self.rng.uniform(-240, 1020),
                 "y": self.rng.uniform(20, 220),
@@ -215,30 +396,81 @@ class WeatherRenderer:
             }
             for _ in range(14)
         ]
-        self.rain_drops = [
-            {
-                "x": self.rng.uniform(0, 800),
-                "y": self.rng.uniform(-600, 600),
-                "vx": self.rng.uniform(-40, -20),
-                "vy": self.rng.uniform(340, 620),
-                "len": self.rng.randint(10, 18),
-                "trail": [],
-            }
-            for _ in range(320)
-        ]
-        self.snow_flakes = [
-            {
-                "x": self.rng.uniform(0, 800),
-                "y": self.rng.uniform(-600, 600),
-                "vy": self.rng.uniform(38, 105),
-                "size": self.rng.uniform(1.0, 2.8),
-                "drift": self.rng.uniform(18, 45),
-                "phase": self.rng.uniform(0, math.tau),
-            }
-            for _ in range(180)
-        ]
-        self.splashes: list[dict[str, float]] = []
-        self.arcane_streaks: list[dict[str, float]] = []
+        # Size and tone never change, so each cloud's sprite is rendered once.
+        for cloud in self.clouds:
+            cloud["surf"] = self._render_cloud(cloud)
+        # Rain and snow are stored as parallel columns so updates run as list comprehensions.
+        rng = self.rng
+        self.rain: dict[str, list] = {
+            "x": _uniform_column(rng, 0, 800, 320),
+            "y": _uniform_column(rng, -600, 600, 320),
+            "vx": _uniform_column(rng, -40, -20, 320),
+            "vy": _uniform_column(rng, 340, 620, 320),
+            "len": rng.choices(range(10, 19), k=320),
+        }
+        # Trail spacing is how far a drop falls per frame, bucketed to whole pixels.
+        self.rain["step"] = [self._trail_step(vy) for vy in self.rain["vy"]]
+        self.snow: dict[str, list[float]] = {
+            "x": _uniform_column(rng, 0, 800, 180),
+            "y": _uniform_column(rng, -600, 600, 180),
+            "vy": _uniform_column(rng, 38, 105, 180),
+            "size": _uniform_column(rng, 1.0, 2.8, 180),
+            "drift": _uniform_column(rng, 18, 45, 180),
+            "phase": _uniform_column(rng, 0, math.tau, 180),
+        }
+        self.splashes: dict[str, list[float]] = {"x": [], "y": [], "life": [], "r": []}
+        self.arcane_streaks: dict[str, list[float]] = {"x": [], "y": [], "vx": [], "vy": [], "life": [], "len": []}
+        self._rain_streaks = {
+            (length, step): self._build_rain_streak(length, step)
+            for length in range(10, 19)
+            for step in range(self._trail_step(340), self._trail_step(620) + 1)
+        }
+        self._dot_sprites: dict[tuple[int, tuple[int, int, int, int], int], pygame.Surface] = {}
+        # Screen-sized effect layer and constant tints, rebuilt only when the screen size changes.
+        self._layer_size: tuple[int, int] | None = None
+        self._fx_layer: pygame.Surface | None = None
+        self._tints: dict[tuple[int, int, int, int], pygame.Surface] = {}
+
+    def _get_fx_layer(self, size: tuple[int, int]) -> pygame.Surface:
+        if size != self._layer_size:
+            self._fx_layer = pygame.Surface(size, pygame.SRCALPHA)
+            self._tints.clear()
+            self._layer_size = size
+        else:
+            self._fx_layer.fill((0, 0, 0, 0))
+        return self._fx_layer
+
+    def _get_tint(self, size: tuple[int, int], color: tuple[int, int, int, int]) -> pygame.Surface:
+        # Callers fetch the fx layer first, which resets this cache on a size change.
+        tint = self._tints.get(color)
+        if tint is None:
+            tint = pygame.Surface(size, pygame.SRCALPHA)
+            tint.fill(color)
+            tint = to_display_format(tint)
+            self._tints[color] = tint
+        return tint
+
+    def _dot(self, radius: int, color: tuple[int, int, int, int], width: int = 0) -> pygame.Surface:
+        # Alpha is quantised by the callers, so the sprite set stays small.
+        key = (radius, color, width)
+        sprite = self._dot_sprites.get(key)
+        if sprite is None:
+            sprite = self._dot_sprites[key] = _make_dot(radius, color, width)
+        return sprite
+
+    @staticmethod
+    def _trail_step(vy: float) -> int:
+        return int(vy / RAIN_TRAIL_FPS + 0.5)
+
+    def _build_rain_streak(self, length: int, step: int) -> pygame.Surface:
+        # The fading trail above the drop is baked in; the drop itself sits at the bottom.
+        trail_h = RAIN_TRAIL_LEN * step
+        streak = pygame.Surface((2, trail_h + length + 1), pygame.SRCALPHA)
+        for i in range(1, RAIN_TRAIL_LEN):
+            y0 = (i - 1) * step
+            pygame.draw.line(streak, (120, 170, 255, 25 + i * 16), (1, y0), (1, y0 + step), 1)
+        pygame.draw.line(streak, (170, 210, 255, 180), (1, trail_h), (0, trail_h + length), 1)
+        return to_display_format(streak)
 
     def update(self, dt: float, weather: str, screen_w: int, screen_h: int) -> None:
         self.wind_phase += dt * 0.9
@@ -250,72 +482,61 @@ class WeatherRenderer:
                 c["x"] = -280
                 c["y"] = self.rng.uniform(20, 220)
 
+        rain = self.rain
         if weather == "rain":
-            for d in self.rain_drops:
-                d["trail"].append((d["x"], d["y"]))
-                if len(d["trail"]) > 4:
-                    d["trail"].pop(0)
-                d["x"] += d["vx"] * dt
-                d["y"] += d["vy"] * dt
-                if d["y"] > screen_h + 15:
-                    self.splashes.append(
-                        {
-                            "x": d["x"],
-                            "y": screen_h - self.rng.uniform(4, 22),
-                            "life": 0.22,
-                            "max_life": 0.22,
-                            "r": self.rng.uniform(3.0, 7.5),
-                        }
-                    )
-                    d["y"] = -self.rng.uniform(20, 420)
-                    d["x"] = self.rng.uniform(-30, screen_w + 30)
-                    d["trail"].clear()
-        else:
-            for d in self.rain_drops:
-                d["trail"].clear()
+            rain["x"] = xs = [x + vx * dt for x, vx in zip(rain["x"], rain["vx"])]
+            rain["y"] = ys = [y + vy * dt for y, vy in zip(rain["y"], rain["vy"])]
+            limit = screen_h + 15
+            fallen = [i for i, y in enumerate(ys) if y > limit]
+            if fallen:
+                n = len(fallen)
+                splashes = self.splashes
+                splashes["x"].extend(xs[i] for i in fallen)
+                splashes["y"].extend(screen_h - v for v in _uniform_column(self.rng, 4, 22, n))
+                splashes["life"].extend([SPLASH_MAX_LIFE] * n)
+                splashes["r"].extend(_uniform_column(self.rng, 3.0, 7.5, n))
+                for i, new_y, new_x in zip(
+                    fallen, _uniform_column(self.rng, -420, -20, n), _uniform_column(self.rng, -30, screen_w + 30, n)
+                ):
+                    ys[i] = new_y
+                    xs[i] = new_x
 
         if weather == "snow":
-            for s in self.snow_flakes:
-                s["y"] += s["vy"] * dt
-                s["x"] += math.sin(self.wind_phase + s["phase"]) * s["drift"] * dt
-                if s["y"] > screen_h + 8:
-                    s["y"] = -self.rng.uniform(8, 220)
-                    s["x"] = self.rng.uniform(-10, screen_w + 10)
+            snow = self.snow
+            wind = self.wind_phase
+            sin = math.sin
+            snow["y"] = ys = [y + vy * dt for y, vy in zip(snow["y"], snow["vy"])]
+            snow["x"] = xs = [
+                x + sin(wind + phase) * drift * dt for x, phase, drift in zip(snow["x"], snow["phase"], snow["drift"])
+            ]
+            limit = screen_h + 8
+            fallen = [i for i, y in enumerate(ys) if y > limit]
+            if fallen:
+                n = len(fallen)
+                for i, new_y, new_x in zip(
+                    fallen, _uniform_column(self.rng, -220, -8, n), _uniform_column(self.rng, -10, screen_w + 10, n)
+                ):
+                    ys[i] = new_y
+                    xs[i] = new_x
 
         if weather == "arcane_wind":
             spawn_count = 2 + int(self.rng.random() < 0.3)
+            streaks = self.arcane_streaks
             for _ in range(spawn_count):
-                if len(self.arcane_streaks) > 170:
+                if len(streaks["life"]) > 170:
                     break
-                self.arcane_streaks.append(
-                    {
-                        "x": self.rng.uniform(-40, screen_w + 40),
-                        "y": self.rng.uniform(-20, screen_h + 20),
-                        "vx": self.rng.uniform(90, 220),
-                        "vy": self.rng.uniform(-70, 70),
-                        "life": self.rng.uniform(0.3, 0.7),
-                        "max_life": 0.7,
-                        "len": self.rng.uniform(14, 34),
-                    }
-                )
-
-        alive_streaks = []
-        for st in self.arcane_streaks:
-            st["life"] -= dt
-            st["x"] += st["vx"] * dt
-            st["y"] += st["vy"] * dt
-            if st["life"] > 0:
-                alive_streaks.append(st)
-        self.arcane_streaks = alive_streaks
-
-        alive_splashes = []
-        for sp in self.splashes:
-            sp["life"] -= dt
-            if sp["life"] > 0:
-                alive_splashes.append(sp)
-        self.splashes = alive_splashes
-
-    def _draw_cloud(self, surface: pygame.Surface, cloud: dict[str, float]) -> None:
+                streaks["x"].append(self.rng.uniform(-40, screen_w + 40))
+                streaks["y"].append(self.rng.uniform(-20, screen_h + 20))
+                streaks["vx"].append(self.rng.uniform(90, 220))
+                streaks["vy"].append(self.rng.uniform(-70, 70))
+                streaks["life"].append(self.rng.uniform(0.3, 0.7))
+                streaks["len"].append(self.rng.uniform(14, 34))
+
+        _integrate(self.arcane_streaks, dt)
+
+        _expire(self.splashes, dt)
+
+    def _render_cloud(self, cloud: dict) -> pygame.Surface:
         size = int(cloud["size"])
         tone = int(cloud["tone"])
         cloud_surface = pygame.Surface((size * 2, size), pygame.SRCALPHA)
@@ -326,65 +547,60 @@ class WeatherRenderer:
             (tone, tone, tone, 48),
             (int(size * 1.05), int(size * 0.22), int(size * 0.86), int(size * 0.5)),
         )
-        surface.blit(cloud_surface, (int(cloud["x"]), int(cloud["y"])))
+        return to_display_format(cloud_surface)
 
     def draw(self, surface: pygame.Surface, weather: str) -> None:
         w, h = surface.get_size()
 
-        for cloud in self.clouds:
-            self._draw_cloud(surface, cloud)
+        blit_batch(surface, [(c["surf"], (int(c["x"]), int(c["y"]))) for c in self.clouds])
 
-        fx_layer = pygame.Surface((w, h), pygame.SRCALPHA)
+        fx_layer = self._get_fx_layer((w, h))
         if weather == "rain":
-            for d in self.rain_drops:
-                trail = d["trail"]
-                for i in range(1, len(trail)):
-                    p0 = trail[i - 1]
-                    p1 = trail[i]
-                    alpha = int(25 + i * 16)
-                    pygame.draw.line(
-                        fx_layer,
-                        (120, 170, 255, alpha),
-                        (int(p0[0]), int(p0[1])),
-                        (int(p1[0]), int(p1[1])),
-                        1,
-                    )
-                pygame.draw.line(
-                    fx_layer,
-                    (170, 210, 255, 180),
-                    (int(d["x"]), int(d["y"])),
-                    (int(d["x"] + d["vx"] * 0.03), int(d["y"] + d["len"])),
-                    1,
-                )
-
-            for sp in self.splashes:
-                fade = max(0.0, sp["life"] / sp["max_life"])
-                radius = sp["r"] * (1.0 + (1.0 - fade) * 1.2)
-                alpha = int(130 * fade)
-                pygame.draw.circle(fx_layer, (170, 210, 255, alpha), (int(sp["x"]), int(sp["y"])), int(radius), 1)
-
-            rain_tint = pygame.Surface((w, h), pygame.SRCALPHA)
-            rain_tint.fill((0, 18, 42, 22))
-            surface.blit(rain_tint, (0, 0))
+            rain = self.rain
+            streaks = self._rain_streaks
+            blit_batch(
+                fx_layer,
+                [
+                    (streaks[length, step], (int(x) - 1, int(y) - RAIN_TRAIL_LEN * step))
+                    for length, step, x, y in zip(rain["len"], rain["step"], rain["x"], rain["y"])
+                ],
+            )
+
+            splashes = self.splashes
+            dot = self._dot
+            rings = []
+            for x, y, life, r in zip(splashes["x"], splashes["y"], splashes["life"], splashes["r"]):
+                fade = max(0.0, life / SPLASH_MAX_LIFE)
+                radius = int(r * (1.0 + (1.0 - fade) * 1.2))
+                alpha = int(130 * fade) // SPRITE_ALPHA_STEP * SPRITE_ALPHA_STEP
+                rings.append((dot(radius, (170, 210, 255, alpha), 1), (int(x) - radius, int(y) - radius)))
+            blit_batch(fx_layer, rings)
+
+            surface.blit(self._get_tint((w, h), (0, 18, 42, 22)), (0, 0))
 
         if weather == "snow":
-            for s in self.snow_flakes:
-                sparkle = 0.75 + 0.25 * math.sin(self.wind_phase * 2 + s["phase"])
-                alpha = int(140 + 90 * sparkle)
-                pygame.draw.circle(fx_layer, (245, 248, 255, alpha), (int(s["x"]), int(s["y"])), max(1, int(s["size"])))
+            snow = self.snow
+            wind = self.wind_phase * 2
+            sin = math.sin
+            dot = self._dot
+            flakes = []
+            for x, y, size, phase in zip(snow["x"], snow["y"], snow["size"], snow["phase"]):
+                sparkle = 0.75 + 0.25 * sin(wind + phase)
+                alpha = int(140 + 90 * sparkle) // SPRITE_ALPHA_STEP * SPRITE_ALPHA_STEP
+                radius = max(1, int(size))
+                flakes.append((dot(radius, (245, 248, 255, alpha)), (int(x) - radius, int(y) - radius)))
+            blit_batch(fx_layer, flakes)
 
         if weather == "arcane_wind":
-            for st in self.arcane_streaks:
-                fade = max(0.0, st["life"] / st["max_life"])
-                alpha = int(140 * fade)
-                x1, y1 = int(st["x"]), int(st["y"])
-                x2, y2 = int(st["x"] - st["len"]), int(st["y"] - st["len"] * 0.35)
+            streaks = self.arcane_streaks
+            for x, y, life, length in zip(streaks["x"], streaks["y"], streaks["life"], streaks["len"]):
+                alpha = int(140 * max(0.0, life / ARCANE_STREAK_MAX_LIFE))
+                x1, y1 = int(x), int(y)
+                x2, y2 = int(x - length), int(y - length * 0.35)
                 pygame.draw.line(fx_layer, (190, 120, 255, alpha), (x1, y1), (x2, y2), 2)
                 pygame.draw.line(fx_layer, (120, 225, 255, alpha // 2), (x1, y1), (x2, y2), 1)
 
-            arcane_tint = pygame.Surface((w, h), pygame.SRCALPHA)
-            arcane_tint.fill((22, 0, 40, 22))
-            surface.blit(arcane_tint, (0, 0))
+            surface.blit(self._get_tint((w, h), (22, 0, 40, 22)), (0, 0))
 
         surface.blit(fx_layer, (0, 0))
 
@@ -392,83 +608,91 @@ class WeatherRenderer:
 class AuraRenderer:
     def __init__(self) -> None:
         self.phase = 0.0
+        self._glow_cache: dict[tuple[int, tuple[int, int, int]], list[tuple[pygame.Surface, int, int]]] = {}
+        self._dot_cache: dict[tuple[int, int, int], pygame.Surface] = {}
 
     def update(self, dt: float) -> None:
         self.phase += dt
 
-    def draw_player_aura(self, surface: pygame.Surface, camera, player, cheat_mode: bool, time_slow: bool) -> None:
-        px, py = player.center
-        sx, sy = camera.world_to_screen(px, py)
-        if not cheat_mode and not time_slow:
-            return
-
-        base = 24 + int((math.sin(self.phase * 6.5) + 1) * 3)
-        color = (255, 225, 110) if cheat_mode else (150, 220, 255)
+    def _get_glow_layers(self, base: int, color: tuple[int, int, int]) -> list[tuple[pygame.Surface, int, int]]:
+        """Glow disc plus the three rings as (surface, offset_x, offset_y) relative to the aura centre."""
+        key = (base, color)
+        cached = self._glow_cache.get(key)
+        if cached is not None:
+            return cached
 
+        layers: list[tuple[pygame.Surface, int, int]] = []
         glow = pygame.Surface((base * 4, base * 4), pygame.SRCALPHA)
         for i in range(4):
             radius = base + i * 12
             alpha = max(8, 34 - i * 6)
             pygame.draw.circle(glow, (*color, alpha), (base * 2, base * 2), radius)
-        surface.blit(glow, (sx - base * 2, sy - base * 2))
+        layers.append((to_display_format(glow), -base * 2, -base * 2))
 
         for ring in range(3):
             radius = base + ring * 8
             alpha = max(25, 115 - ring * 32)
             aura = pygame.Surface((radius * 2 + 4, radius * 2 + 4), pygame.SRCALPHA)
             pygame.draw.circle(aura, (*color, alpha), (radius + 2, radius + 2), radius, 2)
-            surface.blit(aura, (sx - radius - 2, sy - radius - 2))
+            layers.append((to_display_format(aura), -radius - 2, -radius - 2))
 
+        self._glow_cache[key] = layers
+        return layers
+
+    def _get_dot(self, color: tuple[int, int, int]) -> pygame.Surface:
+        dot = self._dot_cache.get(color)
+        if dot is None:
+            dot = pygame.Surface((5, 5), pygame.SRCALPHA)
+            pygame.draw.circle(dot, color, (2, 2), 2)
+            dot = to_display_format(dot)
+            self._dot_cache[color] = dot
+        return dot
+
+    def draw_player_aura(self, surface: pygame.Surface, camera, player, cheat_mode: bool, time_slow: bool) -> None:
+        px, py = player.center
+        sx, sy = camera.world_to_screen(px, py)
+        if not cheat_mode and not time_slow:
+            return
+
+        base = 24 + int((math.sin(self.phase * 6.5) + 1) * 3)
+        color = (255, 225, 110) if cheat_mode else (150, 220, 255)
+
+        seq = [(layer, (sx + ox, sy + oy)) for layer, ox, oy in self._get_glow_layers(base, color)]
+
+        dot = self._get_dot(color)
         for i in range(10):
             a = self.phase * 3.2 + i * (math.tau / 10)
             rx = sx + math.cos(a) * (base + 12)
             ry = sy + math.sin(a * 1.1) * (base + 12)
-            pygame.draw.circle(surface, color, (int(rx), int(ry)), 2)
+            seq.append((dot, (int(rx) - 2, int(ry) - 2)))
+        blit_batch(surface, seq)
 
 
 class RuneCircleRenderer:
     def __init__(self) -> None:
         self.t = 0.0
-        self.particles: list[dict[str, float]] = []
+        self.particles: dict[str, list[float]] = {"x": [], "y": [], "vx": [], "vy": [], "life": []}
+        self._rune_cache: dict[int, tuple[pygame.Surface, int]] = {}
 
     def update(self, dt: float) -> None:
         self.t += dt
-        alive: list[dict[str, float]] = []
-        for p in self.particles:
-            p["life"] -= dt
-            p["x"] += p["vx"] * dt
-            p["y"] += p["vy"] * dt
-            if p["life"] > 0:
-                alive.append(p)
-        self.particles = alive
-
-    def draw(self, surface: pygame.Surface, camera, x: float, y: float, active: bool) -> None:
-        if not active:
-            return
+        _integrate(self.particles, dt)
 
-        if random.random() < 0.35:
-            angle = random.uniform(0, math.tau)
-            speed = random.uniform(14, 36)
-            self.particles.append(
-                {
-                    "x": x + math.cos(angle) * random.uniform(6, 28),
-                    "y": y + math.sin(angle) * random.uniform(6, 28),
-                    "vx": math.cos(angle) * speed,
-                    "vy": math.sin(angle) * speed,
-                    "life": random.uniform(0.5, 0.9),
-                    "max_life": 0.9,
-                }
-            )
+    def _get_rune_layer(self, step: int) -> tuple[pygame.Surface, int]:
+        """Rune circle sprite for one animation step and the offset of its centre."""
+        cached = self._rune_cache.get(step)
+        if cached is not None:
+            return cached
 
-        sx, sy = camera.world_to_screen(x, y)
-        radius = 30 + int(math.sin(self.t * 2.2) * 4)
+        t = step / RUNE_STEPS_PER_SECOND
+        radius = 30 + int(math.sin(t * RUNE_PULSE_RATE) * 4)
         layer = pygame.Surface((radius * 2 + 10, radius * 2 + 10), pygame.SRCALPHA)
         cx, cy = radius + 5, radius + 5
         pygame.draw.circle(layer, (190, 120, 255, 128), (cx, cy), radius, 2)
         pygame.draw.circle(layer, (130, 220, 255, 105), (cx, cy), radius - 8, 1)
         pygame.draw.circle(layer, (255, 215, 255, 85), (cx, cy), radius - 15, 1)
         for i in range(8):
-            a = self.t * 1.7 + i * (math.tau / 8)
+            a = t * RUNE_SPOKE_RATE + i * (math.tau / 8)
             x1 = cx + math.cos(a) * (radius - 4)
             y1 = cy + math.sin(a) * (radius - 4)
             x2 = cx + math.cos(a + 0.36) * (radius - 14)
@@ -476,21 +700,40 @@ class RuneCircleRenderer:
             pygame.draw.line(layer, (220, 160, 255, 145), (x1, y1), (x2, y2), 2)
 
         for i in range(6):
-            a = -self.t * 1.25 + i * (math.tau / 6)
+            a = -t * RUNE_ORBIT_RATE + i * (math.tau / 6)
             px = cx + math.cos(a) * (radius - 10)
             py = cy + math.sin(a) * (radius - 10)
             pygame.draw.circle(layer, (130, 230, 255, 150), (int(px), int(py)), 2)
 
-        surface.blit(layer, (sx - cx, sy - cy))
+        built = (to_display_format(layer), cx)
+        self._rune_cache[step] = built
+        return built
+
+    def draw(self, surface: pygame.Surface, camera, x: float, y: float, active: bool) -> None:
+        if not active:
+            return
+
+        if random.random() < 0.35:
+            angle = random.uniform(0, math.tau)
+            speed = random.uniform(14, 36)
+            particles = self.particles
+            particles["x"].append(x + math.cos(angle) * random.uniform(6, 28))
+            particles["y"].append(y + math.sin(angle) * random.uniform(6, 28))
+            particles["vx"].append(math.cos(angle) * speed)
+            particles["vy"].append(math.sin(angle) * speed)
+            particles["life"].append(random.uniform(0.5, 0.9))
+
+        sx, sy = camera.world_to_screen(x, y)
+        layer, c = self._get_rune_layer(int(self.t * RUNE_STEPS_PER_SECOND) % RUNE_CYCLE_STEPS)
+        surface.blit(layer, (sx - c, sy - c))
 
         particles_layer = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        for p in self.particles:
-            px_s, py_s = camera.world_to_screen(p["x"], p["y"])
-            max_life = max(0.001, float(p.get("max_life", 0.9)))
-            alpha = int(max(0, min(255, 200 * (float(p.get("life", 0.0)) / max_life))))
+        particles = self.particles
+        for px, py, life in zip(particles["x"], particles["y"], particles["life"]):
+            alpha = int(max(0, min(255, 200 * (life / RUNE_PARTICLE_MAX_LIFE))))
             if alpha <= 0:
                 continue
-            pygame.draw.circle(particles_layer, (220, 160, 255, alpha), (int(px_s), int(py_s)), 2)
+            pygame.draw.circle(particles_layer, (220, 160, 255, alpha), camera.world_to_screen(px, py), 2)
         surface.blit(particles_layer, (0, 0))
 
 
@@ -499,6 +742,36 @@ class PostProcessing:
         self.vignette_strength = 0.33
         self.bloom_intensity = 0.28
         self._vignette_cache: dict[tuple[int, int, int], pygame.Surface] = {}
+        self._bloom_size: tuple[int, int] | None = None
+        self._bloom_buffers: tuple[pygame.Surface, pygame.Surface, pygame.Surface] | None = None
+        self._tint_size: tuple[int, int] | None = None
+        self._tints: dict[tuple[int, int, int, int], pygame.Surface] = {}
+
+    def _get_bloom_buffers(self, surface: pygame.Surface) -> tuple[pygame.Surface, pygame.Surface, pygame.Surface]:
+        """Persistent (small, small_blurred, full) scratch surfaces matching the target's format."""
+        size = surface.get_size()
+        if self._bloom_buffers is None or self._bloom_size != size:
+            w, h = size
+            small_size = (max(1, w // 6), max(1, h // 6))
+            self._bloom_buffers = (
+                pygame.Surface(small_size, 0, surface),
+                pygame.Surface(small_size, 0, surface),
+                pygame.Surface(size, 0, surface),
+            )
+            self._bloom_size = size
+        return self._bloom_buffers
+
+    def _get_tint(self, size: tuple[int, int], color: tuple[int, int, int, int]) -> pygame.Surface:
+        if size != self._tint_size:
+            self._tints.clear()
+            self._tint_size = size
+        tint = self._tints.get(color)
+        if tint is None:
+            tint = pygame.Surface(size, pygame.SRCALPHA)
+            tint.fill(color)
+            tint = to_display_format(tint)
+            self._tints[color] = tint
+        return tint
 
     def _get_vignette(self, size: tuple[int, int]) -> pygame.Surface:
         w, h = size
@@ -507,20 +780,19 @@ class PostProcessing:
         if key in self._vignette_cache:
             return self._vignette_cache[key]
 
-        mask = pygame.Surface((w, h), pygame.SRCALPHA)
-        steps = 14
-        max_inset = int(min(w, h) * 0.28)
-        for i in range(steps):
-            t = i / max(1, steps - 1)
-            inset = int(max_inset * t)
-            alpha = int((1.0 - t) ** 1.8 * (18 + strength // 7))
-            rect = pygame.Rect(inset, inset, w - inset * 2, h - inset * 2)
-            if rect.width <= 0 or rect.height <= 0:
-                continue
-            border = max(1, int(4 - t * 2))
-            radius = max(4, int(min(rect.width, rect.height) * 0.16))
-            pygame.draw.rect(mask, (0, 0, 0, alpha), rect, border, border_radius=radius)
-
+        # Radial falloff built at low resolution; smoothscale interpolates it up to screen size.
+        res = VIGNETTE_RES
+        peak = 255 * strength / 100
+        small = pygame.Surface((res, res), pygame.SRCALPHA)
+        for py in range(res):
+            dy = (py + 0.5) / res - 0.5
+            for px in range(res):
+                r = math.hypot((px + 0.5) / res - 0.5, dy) * 2
+                if r > 0.7:
+                    small.set_at((px, py), (0, 0, 0, int(min(1.0, r - 0.7) ** 1.8 * peak)))
+        mask = pygame.transform.smoothscale(small, (w, h))
+
+        mask = to_display_format(mask)
         self._vignette_cache[key] = mask
         return mask
 
@@ -532,46 +804,44 @@ class PostProcessing:
         if self.bloom_intensity <= 0:
             return
 
-        w, h = surface.get_size()
-        small_w = max(1, w // 3)
-        small_h = max(1, h // 3)
-        mini = pygame.transform.smoothscale(surface, (small_w, small_h))
-        mini.fill((110, 110, 110, 0), special_flags=pygame.BLEND_RGBA_SUB)
-
-        blur_a = pygame.transform.smoothscale(mini, (max(1, w // 6), max(1, h // 6)))
-        blur_b = pygame.transform.smoothscale(blur_a, (small_w, small_h))
-        blur_full = pygame.transform.smoothscale(blur_b, (w, h))
-        blur_full.set_alpha(int(255 * self.bloom_intensity))
-        surface.blit(blur_full, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        small, blurred, full = self._get_bloom_buffers(surface)
+        pygame.transform.smoothscale(surface, small.get_size(), small)
+        small.fill((110, 110, 110, 0), special_flags=pygame.BLEND_RGBA_SUB)
+        if _HAS_BOX_BLUR:
+            pygame.transform.box_blur(small, 1, dest_surface=blurred)
+            small = blurred
+        pygame.transform.smoothscale(small, full.get_size(), full)
+        full.set_alpha(int(255 * self.bloom_intensity))
+        surface.blit(full, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
 
     def apply_color_grading(self, surface: pygame.Surface, time_of_day: float = 12.0, weather: str = "clear") -> None:
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        size = surface.get_size()
         t = _wrap_hour(time_of_day)
 
         if t < 6 or t > 19:
-            overlay.fill((0, 18, 52, 28))
+            tint = (0, 18, 52, 28)
         elif 17 <= t <= 19:
-            overlay.fill((34, 12, 0, 28))
+            tint = (34, 12, 0, 28)
         elif 6 <= t < 8:
-            overlay.fill((18, 7, 0, 18))
+            tint = (18, 7, 0, 18)
         else:
-            overlay.fill((8, 5, 0, 11))
-        surface.blit(overlay, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            tint = (8, 5, 0, 11)
+        if weather == "arcane_wind":
+            # Saturating adds compose, so both additive tints collapse into one colour.
+            tint = tuple(min(255, a + b) for a, b in zip(tint, (16, 0, 28, 20)))
+        # A uniform additive tint needs no source surface; one flagged fill grades the frame.
+        surface.fill(tint, special_flags=pygame.BLEND_RGBA_ADD)
 
         if weather == "rain":
-            cool = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            cool.fill((0, 10, 32, 24))
-            surface.blit(cool, (0, 0))
-        elif weather == "arcane_wind":
-            arcane = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-            arcane.fill((16, 0, 28, 20))
-            surface.blit(arcane, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            # The rain wash is a normal alpha blend, which cannot be folded into the additive pass.
+            surface.blit(self._get_tint(size, (0, 10, 32, 24)), (0, 0))
 
 
 class ScreenShake:
     def __init__(self) -> None:
         self.time_left = 0.0
         self.intensity = 0.0
+        self._i = 0
 
     def kick(self, intensity: float, duration: float = 0.16) -> None:
         self.time_left = max(self.time_left, duration)
@@ -584,4 +854,7 @@ class ScreenShake:
         self.time_left -= dt
         fade = max(0.0, self.time_left / 0.16)
         amp = self.intensity * fade
-        return random.randint(-int(amp), int(amp)), random.randint(-int(amp), int(amp))
+        # The ring is read as consecutive (x, y) pairs, so the index advances two steps per frame.
+        i = self._i = (self._i + 2) & 511
+        scale = amp / 127
+        return int(_SHAKE_NOISE[i] * scale), int(_SHAKE_NOISE[i + 1] * scale)
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import base64
 import math
 import random
+import sys
+from array import array
 from dataclasses import dataclass
 
 import pygame
 
+from utils import blit_batch, to_display_format
+
 TILE_SIZE = 32
 CHUNK_SIZE = 32
+CHUNK_PX = TILE_SIZE * CHUNK_SIZE
+# Baked chunk surfaces are 4 MB each; a few screens' worth is kept around.
+CHUNK_SURFACE_CACHE_SIZE = 12
+FOG_COLOR = (12, 12, 22, 180)
+# Lattice cells per tile per unit of noise frequency; 0.06 gives cells ~48 tiles wide.
+NOISE_LATTICE_SCALE = 0.35
+NOISE_LATTICE_CACHE_SIZE = 2048
+# How far a prop's drawing can overhang its own tile, in pixels.
+PROP_OVERHANG = TILE_SIZE
 
 TILE_COLORS = {
     "grass": (80, 172, 92),
@@ -25,27 +39,86 @@ TILE_COLORS = {
     "village_road": (150, 122, 90),
 }
 
+# Chunks store one byte per tile; these tables map between IDs and names.
+TILE_NAMES = tuple(TILE_COLORS)
+TILE_IDS = {name: tile_id for tile_id, name in enumerate(TILE_NAMES)}
+SOLID_TILES = frozenset({"water", "stone"})
+# A chunk tile byte packs the tile ID in its low bits and the texture variant above them.
+TILE_VARIANT_SHIFT = 6
+TILE_ID_MASK = (1 << TILE_VARIANT_SHIFT) - 1
+# 256-entry table over packed bytes so it can drive bytearray.translate as well as direct indexing.
+_SOLID_TABLE = bytes(
+    1 if (b & TILE_ID_MASK) < len(TILE_NAMES) and TILE_NAMES[b & TILE_ID_MASK] in SOLID_TILES else 0 for b in range(256)
+)
+# Pixel offset of each tile within a chunk surface, in tile byte order.
+_CHUNK_TILE_OFFSETS = tuple((lx * TILE_SIZE, ly * TILE_SIZE) for ly in range(CHUNK_SIZE) for lx in range(CHUNK_SIZE))
+_WATER_ID = TILE_IDS["water"]
+_GRASS_ID = TILE_IDS["grass"]
+_STONE_ID = TILE_IDS["stone"]
+_DIRT_ID = TILE_IDS["dirt"]
+_DUNGEON_ID = TILE_IDS["dungeon"]
+_RUINS_ID = TILE_IDS["ruins"]
+_CASTLE_FLOOR_ID = TILE_IDS["castle_floor"]
+_CASTLE_WALL_ID = TILE_IDS["castle_wall"]
+_VILLAGE_HOUSE_ID = TILE_IDS["village_house"]
+_VILLAGE_ROAD_ID = TILE_IDS["village_road"]
+
+# Per-biome generation rule: (tile when detail noise > cutoff, tile otherwise, cutoff, prop kind, prop chance).
+_BIOME_RULES: dict[str, tuple[int, int, float, str | None, float]] = {
+    "castle_floor": (_CASTLE_FLOOR_ID, _CASTLE_FLOOR_ID, 0.0, "castle_tower", 0.02),
+    "castle_wall": (_CASTLE_WALL_ID, _CASTLE_WALL_ID, 0.0, "castle_wall_prop", 0.1),
+    "village_house": (_VILLAGE_HOUSE_ID, _VILLAGE_HOUSE_ID, 0.0, "house", 0.15),
+    "village_road": (_VILLAGE_ROAD_ID, _VILLAGE_ROAD_ID, 0.0, None, 0.0),
+    "plains": (_GRASS_ID, _DIRT_ID, -0.1, None, 0.0),
+    "forest": (_GRASS_ID, _DIRT_ID, -0.2, "tree", 0.08),
+    "mountains": (_STONE_ID, _DIRT_ID, -0.35, "rock", 0.05),
+    "dungeon": (_DUNGEON_ID, _STONE_ID, -0.3, "obelisk", 0.025),
+    "village_ruins": (_RUINS_ID, _DIRT_ID, -0.2, "pillar", 0.04),
+}
+# Chunks store biomes as one byte per tile too, indexing these.
+BIOME_NAMES = tuple(_BIOME_RULES)
+BIOME_IDS = {name: biome_id for biome_id, name in enumerate(BIOME_NAMES)}
+_BIOME_RULES_BY_ID = tuple(_BIOME_RULES.values())
+
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Chunk:
-    tiles: list[list[str]]
-    props: list[tuple[str, int, int]]
+    # Row-major packed tile bytes (ID | variant << TILE_VARIANT_SHIFT), indexed as ``ly * CHUNK_SIZE + lx``.
+    tiles: bytearray
+    # At most one prop per tile, keyed by world tile coordinates.
+    props: dict[tuple[int, int], tuple[str, int, int]]
+    # Row-major biome IDs (see BIOME_NAMES), same indexing as ``tiles``.
+    biomes: bytearray
+    # 1 where movement is blocked: solid terrain, overridden by any player block on the tile.
+    solid_mask: bytearray
+    # Tiles pre-rendered on first draw; dropped when evicted.
+    surface: pygame.Surface | None = None
+    # Fog of war at one pixel per tile, and its full-size scaled copy for drawing.
+    fog_mask: pygame.Surface | None = None
+    fog: pygame.Surface | None = None
+    fog_left: int = CHUNK_SIZE * CHUNK_SIZE
 
 
 class World:
     def __init__(self, seed: int = 42) -> None:
         self.seed = seed
         self.chunks: dict[tuple[int, int], Chunk] = {}
-        self.discovered_tiles: set[tuple[int, int]] = set()
+        # Fog-of-war state: one bit per tile, 128 bytes per chunk, keyed by chunk coords.
+        # Kept apart from Chunk because chunks are regenerable while discovery is save data.
+        self.discovered_chunks: dict[tuple[int, int], bytearray] = {}
         self.player_blocks: dict[tuple[int, int], str] = {}
         self.time_of_day = 8.0
         self.weather = "clear"
         self.weather_timer = 40.0
 
-        self._tile_cache: dict[tuple[str, int], pygame.Surface] = {}
-        self._tile_darkness_cache: dict[int, pygame.Surface] = {}
-        self._fog_tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        self._fog_tile.fill((12, 12, 22, 180))
+        # FIFO of recent lattice values; lattice points are tens of tiles apart, so the
+        # area around the player (minimap, HUD biome lookups) fits with room to spare.
+        self._lattice_cache: dict[tuple[int, int, int], float] = {}
+        # Tile textures indexed by packed tile byte, built on first use.
+        self._tile_cache: list[pygame.Surface | None] = [None] * 256
+        self._darkness_layer: pygame.Surface | None = None
+        self._darkness_key: tuple[int, int, int] | None = None
+        self._baked_chunks: dict[tuple[int, int], None] = {}
 
     def _clamp_channel(self, value: int) -> int:
         return max(0, min(255, value))
@@ -57,41 +130,120 @@ class World:
             self._clamp_channel(color[2] + delta),
         )
 
-    def _cell_rng(self, x: int, y: int) -> random.Random:
-        value = (x * 73856093) ^ (y * 19349663) ^ (self.seed * 83492791)
-        return random.Random(value)
+    def _lattice(self, ix: int, iy: int, salt: int) -> float:
+        """Hashed value in [-1, 1] at an integer lattice point; ``salt`` separates noise fields."""
+        key = (ix, iy, salt)
+        value = self._lattice_cache.get(key)
+        if value is None:
+            h = ((ix * 73856093) ^ (iy * 19349663) ^ (self.seed * 83492791) ^ (salt * 2654435761)) & 0xFFFFFFFF
+            h ^= h >> 13
+            h = (h * 0x5BD1E995) & 0xFFFFFFFF
+            h ^= h >> 15
+            if len(self._lattice_cache) >= NOISE_LATTICE_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the oldest entry.
+                del self._lattice_cache[next(iter(self._lattice_cache))]
+            value = self._lattice_cache[key] = h * (2.0 / 0xFFFFFFFF) - 1.0
+        return value
 
     def _noise(self, x: int, y: int, freq: float = 0.06) -> float:
-        return (
-            math.sin((x + self.seed * 3) * freq)
-            + math.cos((y - self.seed * 5) * freq * 0.8)
-            + math.sin((x + y) * freq * 0.65)
-        ) / 3.0
+        # Value noise: smoothstep-blended lattice hashes, one lattice cell per ~1 / (freq * scale) tiles.
+        scale = freq * NOISE_LATTICE_SCALE
+        salt = int(freq * 1000)
+        fx = x * scale
+        fy = y * scale
+        ix = math.floor(fx)
+        iy = math.floor(fy)
+        u = fx - ix
+        v = fy - iy
+        u = u * u * (3.0 - 2.0 * u)
+        v = v * v * (3.0 - 2.0 * v)
+        lattice = self._lattice
+        a = lattice(ix, iy, salt)
+        b = lattice(ix + 1, iy, salt)
+        c = lattice(ix, iy + 1, salt)
+        d = lattice(ix + 1, iy + 1, salt)
+        top = a + (b - a) * u
+        bottom = c + (d - c) * u
+        return top + (bottom - top) * v
+
+    def _noise_grid(self, x0: int, y0: int, size: int, freq: float = 0.06, step: int = 1) -> list[list[float]]:
+        """``_noise`` sampled on a ``size`` x ``size`` lattice, as rows of ``x0 + lx * step``."""
+        # A chunk spans only a few lattice cells, so each lattice row is blended
+        # along x once and every tile row is a single lerp between two such lines.
+        # The arithmetic matches _noise step for step, so both agree exactly.
+        scale = freq * NOISE_LATTICE_SCALE
+        salt = int(freq * 1000)
+        floor = math.floor
+        col_ix: list[int] = []
+        col_u: list[float] = []
+        for i in range(size):
+            fx = (x0 + i * step) * scale
+            ix = floor(fx)
+            u = fx - ix
+            col_ix.append(ix)
+            col_u.append(u * u * (3.0 - 2.0 * u))
+
+        lines: dict[int, list[float]] = {}
+
+        def line(iy: int) -> list[float]:
+            cached = lines.get(iy)
+            if cached is None:
+                values = {ix: self._lattice(ix, iy, salt) for ix in range(col_ix[0], col_ix[-1] + 2)}
+                cached = lines[iy] = [
+                    values[ix] + (values[ix + 1] - values[ix]) * u for ix, u in zip(col_ix, col_u)
+                ]
+            return cached
 
-    def _tile_variant(self, tx: int, ty: int) -> int:
-        value = (tx * 92837111) ^ (ty * 689287499) ^ (self.seed * 283923481)
-        return value & 3
+        grid: list[list[float]] = []
+        for i in range(size):
+            fy = (y0 + i * step) * scale
+            iy = floor(fy)
+            v = fy - iy
+            v = v * v * (3.0 - 2.0 * v)
+            top = line(iy)
+            grid.append([t + (b - t) * v for t, b in zip(top, line(iy + 1))])
+        return grid
 
     def _tile_key(self, tile: str, variant: int) -> int:
         return sum(ord(ch) for ch in tile) * 17 + variant * 101 + self.seed * 13
 
     def _build_tile_surface(self, tile: str, variant: int) -> pygame.Surface:
         base = TILE_COLORS.get(tile, (255, 0, 255))
-        surf = pygame.Surface((TILE_SIZE, TILE_SIZE))
         rng = random.Random(self._tile_key(tile, variant))
-
+        # randint(a, b) is randrange(a, b + 1) underneath; calling it directly keeps the stream identical.
+        randrange = rng.randrange
+        shifted: dict[int, bytes] = {}
+
+        def shade_bytes(delta: int) -> bytes:
+            packed = shifted.get(delta)
+            if packed is None:
+                packed = shifted[delta] = bytes(self._color_shift(base, delta))
+            return packed
+
+        # Per-pixel work goes into one packed RGB buffer; whole gradient rows are
+        # repeated byte strings and single pixels are slice writes, not set_at calls.
+        pixels = bytearray()
         for y in range(TILE_SIZE):
             t = y / max(1, TILE_SIZE - 1)
             shade = int((t - 0.25) * 24)
-            row_col = self._color_shift(base, -shade)
-            pygame.draw.line(surf, row_col, (0, y), (TILE_SIZE - 1, y))
+            pixels += shade_bytes(-shade) * TILE_SIZE
 
         # Fine variation to avoid flat blocks.
         for _ in range(34):
-            px = rng.randint(0, TILE_SIZE - 1)
-            py = rng.randint(0, TILE_SIZE - 1)
-            delta = rng.randint(-18, 18)
-            surf.set_at((px, py), self._color_shift(base, delta))
+            px = randrange(TILE_SIZE)
+            py = randrange(TILE_SIZE)
+            delta = randrange(-18, 19)
+            i = (py * TILE_SIZE + px) * 3
+            pixels[i : i + 3] = shade_bytes(delta)
+
+        if tile in {"dirt", "village_road", "village_house"}:
+            for _ in range(24):
+                px = randrange(TILE_SIZE)
+                py = randrange(TILE_SIZE)
+                i = (py * TILE_SIZE + px) * 3
+                pixels[i : i + 3] = shade_bytes(randrange(-26, 13))
+
+        surf = pygame.image.frombuffer(pixels, (TILE_SIZE, TILE_SIZE), "RGB").copy()
 
         if tile == "grass":
             for _ in range(8):
@@ -110,43 +262,101 @@ class World:
                 x1 = x0 + rng.randint(-6, 6)
                 y1 = y0 + rng.randint(-6, 6)
                 pygame.draw.line(surf, self._color_shift(base, -28), (x0, y0), (x1, y1), 1)
-        elif tile in {"dirt", "village_road", "village_house"}:
-            for _ in range(24):
-                px = rng.randint(0, TILE_SIZE - 1)
-                py = rng.randint(0, TILE_SIZE - 1)
-                surf.set_at((px, py), self._color_shift(base, rng.randint(-26, 12)))
 
+        # Edge highlights go last so they sit on top of any detail strokes.
+        surf.fill(self._color_shift(base, 10), (0, 0, TILE_SIZE, 1))
+        surf.fill(self._color_shift(base, -16), (0, TILE_SIZE - 1, TILE_SIZE, 1))
         return surf
 
-    def _get_tile_surface(self, tile: str, tx: int, ty: int) -> pygame.Surface:
-        variant = self._tile_variant(tx, ty)
-        key = (tile, variant)
-        cached = self._tile_cache.get(key)
-        if cached is not None:
-            return cached
-        built = self._build_tile_surface(tile, variant)
-        self._tile_cache[key] = built
-        return built
+    def _get_tile_surface(self, packed: int) -> pygame.Surface:
+        cached = self._tile_cache[packed]
+        if cached is None:
+            tile = TILE_NAMES[packed & TILE_ID_MASK]
+            cached = self._tile_cache[packed] = to_display_format(self._build_tile_surface(tile, packed >> TILE_VARIANT_SHIFT))
+        return cached
+
+    def _render_chunk_surface(self, chunk: Chunk) -> pygame.Surface:
+        surf = to_display_format(pygame.Surface((CHUNK_PX, CHUNK_PX)))
+        # Build any missing textures first, then the blit list is a straight table lookup per byte.
+        for packed in set(chunk.tiles):
+            self._get_tile_surface(packed)
+        cache = self._tile_cache
+        blit_batch(surf, [(cache[packed], pos) for packed, pos in zip(chunk.tiles, _CHUNK_TILE_OFFSETS)])
+        return surf
 
-    def _get_dark_tile(self, alpha: int) -> pygame.Surface:
+    def _get_chunk_surface(self, cx: int, cy: int) -> pygame.Surface:
+        key = (cx, cy)
+        chunk = self.get_chunk(cx, cy)
+        baked = self._baked_chunks
+        if chunk.surface is None:
+            chunk.surface = self._render_chunk_surface(chunk)
+            if len(baked) >= CHUNK_SURFACE_CACHE_SIZE:
+                # Dicts keep insertion order, so the first key is the least recently drawn chunk.
+                oldest = next(iter(baked))
+                del baked[oldest]
+                evicted = self.chunks[oldest]
+                evicted.surface = None
+                evicted.fog = None
+        else:
+            baked.pop(key, None)
+        baked[key] = None
+        return chunk.surface
+
+    def _get_chunk_fog(self, cx: int, cy: int) -> pygame.Surface | None:
+        """Full-size fog overlay for a chunk, or None once every tile in it is discovered."""
+        chunk = self.get_chunk(cx, cy)
+        if chunk.fog_mask is None:
+            mask = pygame.Surface((CHUNK_SIZE, CHUNK_SIZE), pygame.SRCALPHA)
+            mask.fill(FOG_COLOR)
+            bits = self.discovered_chunks.get((cx, cy))
+            left = CHUNK_SIZE * CHUNK_SIZE
+            if bits is not None:
+                for idx in range(CHUNK_SIZE * CHUNK_SIZE):
+                    if (bits[idx >> 3] >> (idx & 7)) & 1:
+                        mask.set_at((idx % CHUNK_SIZE, idx // CHUNK_SIZE), (0, 0, 0, 0))
+                        left -= 1
+            chunk.fog_mask = mask
+            chunk.fog_left = left
+            chunk.fog = None
+        if chunk.fog_left == 0:
+            return None
+        if chunk.fog is None:
+            chunk.fog = to_display_format(pygame.transform.scale(chunk.fog_mask, (CHUNK_PX, CHUNK_PX)))
+        return chunk.fog
+
+    def _get_darkness_layer(self, screen_w: int, screen_h: int, alpha: int) -> pygame.Surface:
+        # One screen-sized layer, refilled only when the size or the (slowly changing) alpha moves.
         alpha = max(0, min(190, alpha))
-        if alpha not in self._tile_darkness_cache:
-            tile = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-            tile.fill((8, 10, 18, alpha))
-            self._tile_darkness_cache[alpha] = tile
-        return self._tile_darkness_cache[alpha]
+        key = (screen_w, screen_h, alpha)
+        if self._darkness_key != key:
+            if self._darkness_layer is None or self._darkness_layer.get_size() != (screen_w, screen_h):
+                self._darkness_layer = to_display_format(pygame.Surface((screen_w, screen_h), pygame.SRCALPHA))
+            self._darkness_layer.fill((8, 10, 18, alpha))
+            self._darkness_key = key
+        return self._darkness_layer
 
     def biome_at(self, tx: int, ty: int) -> str:
-        n = self._noise(tx, ty)
-        m = self._noise(tx + 999, ty - 431, 0.08)
-        castle_dist = math.hypot(tx - 200, ty - 200)
-        village_dist = math.hypot(tx - 400, ty - 300)
-
-        if castle_dist < 50:
-            return "castle_floor" if castle_dist < 30 else "castle_wall"
-
-        if village_dist < 80:
-            return "village_house" if village_dist < 60 else "village_road"
+        # Generated chunks keep their biome grid, so lookups near the player are a byte index.
+        chunk = self.chunks.get((tx // CHUNK_SIZE, ty // CHUNK_SIZE))
+        if chunk is not None:
+            return BIOME_NAMES[chunk.biomes[(ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE]]
+        return self._classify_biome(tx, ty, self._noise(tx, ty), self._noise(tx + 999, ty - 431, 0.08))
+
+    def _classify_biome(self, tx: int, ty: int, n: float, m: float) -> str:
+        # Squared distances against squared radii; the box test skips the multiply for almost every tile.
+        dx = tx - 200
+        dy = ty - 200
+        if -50 < dx < 50 and -50 < dy < 50:
+            d2 = dx * dx + dy * dy
+            if d2 < 2500:
+                return "castle_floor" if d2 < 900 else "castle_wall"
+
+        dx = tx - 400
+        dy = ty - 300
+        if -80 < dx < 80 and -80 < dy < 80:
+            d2 = dx * dx + dy * dy
+            if d2 < 6400:
+                return "village_house" if d2 < 3600 else "village_road"
 
         if n < -0.22:
             return "mountains"
@@ -159,105 +369,176 @@ class World:
         return "dungeon"
 
     def generate_chunk(self, cx: int, cy: int) -> Chunk:
-        tiles: list[list[str]] = [["grass" for _ in range(CHUNK_SIZE)] for _ in range(CHUNK_SIZE)]
-        props: list[tuple[str, int, int]] = []
-
+        tiles = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+        props: dict[tuple[int, int], tuple[str, int, int]] = {}
+        biomes = bytearray(CHUNK_SIZE * CHUNK_SIZE)
+
+        x0 = cx * CHUNK_SIZE
+        y0 = cy * CHUNK_SIZE
+        # All four noise fields for the chunk are evaluated up front as grids.
+        biome_noise = self._noise_grid(x0, y0, CHUNK_SIZE)
+        ruin_noise = self._noise_grid(x0 + 999, y0 - 431, CHUNK_SIZE, 0.08)
+        detail_noise = self._noise_grid(x0 * 2, y0 * 2, CHUNK_SIZE, 0.1, step=2)
+        water_noise = self._noise_grid(x0 - 350, y0 + 177, CHUNK_SIZE, 0.12)
+
+        # The tile loop is table-driven. Prop rolls come from an integer hash of the
+        # tile position and seed mapped to [0, 1); its row and seed terms are folded once per row.
+        rules = _BIOME_RULES_BY_ID
+        classify = self._classify_biome
+        seed_term = self.seed * 83492791
+        variant_seed_term = self.seed * 283923481
         for ly in range(CHUNK_SIZE):
+            ty = y0 + ly
+            row_hash = (ty * 19349663) ^ seed_term
+            variant_row = (ty * 689287499) ^ variant_seed_term
+            val_row = detail_noise[ly]
+            water_row = water_noise[ly]
+            row_start = ly * CHUNK_SIZE
+            biome_row = [
+                BIOME_IDS[classify(x0 + lx, ty, n, m)] for lx, n, m in zip(range(CHUNK_SIZE), biome_noise[ly], ruin_noise[ly])
+            ]
+            biomes[row_start : row_start + CHUNK_SIZE] = bytes(biome_row)
             for lx in range(CHUNK_SIZE):
-                tx = cx * CHUNK_SIZE + lx
-                ty = cy * CHUNK_SIZE + ly
-                biome = self.biome_at(tx, ty)
-                rng = self._cell_rng(tx, ty)
-                val = self._noise(tx * 2, ty * 2, 0.1)
-
-                if biome == "castle_floor":
-                    tile = "castle_floor"
-                    if rng.random() < 0.02:
-                        props.append(("castle_tower", tx, ty))
-                elif biome == "castle_wall":
-                    tile = "castle_wall"
-                    if rng.random() < 0.1:
-                        props.append(("castle_wall_prop", tx, ty))
-                elif biome == "village_house":
-                    tile = "village_house"
-                    if rng.random() < 0.15:
-                        props.append(("house", tx, ty))
-                elif biome == "village_road":
-                    tile = "village_road"
-                elif biome == "plains":
-                    tile = "grass" if val > -0.1 else "dirt"
-                elif biome == "forest":
-                    tile = "grass" if val > -0.2 else "dirt"
-                    if rng.random() < 0.08:
-                        props.append(("tree", tx, ty))
-                elif biome == "mountains":
-                    tile = "stone" if val > -0.35 else "dirt"
-                    if rng.random() < 0.05:
-                        props.append(("rock", tx, ty))
-                elif biome == "dungeon":
-                    tile = "dungeon" if val > -0.3 else "stone"
-                    if rng.random() < 0.025:
-                        props.append(("obelisk", tx, ty))
+                high, low, cutoff, kind, chance = rules[biome_row[lx]]
+                if water_row[lx] > 0.45:
+                    tile = _WATER_ID
                 else:
-                    tile = "ruins" if val > -0.2 else "dirt"
-                    if rng.random() < 0.04:
-                        props.append(("pillar", tx, ty))
-
-                if self._noise(tx - 350, ty + 177, 0.12) > 0.45:
-                    tile = "water"
-
-                tiles[ly][lx] = tile
-        return Chunk(tiles=tiles, props=props)
+                    tile = high if val_row[lx] > cutoff else low
+                tx = x0 + lx
+                # Two-bit texture variant, a fixed hash of the tile position.
+                tiles[row_start + lx] = tile | (((tx * 92837111) ^ variant_row) & 3) << TILE_VARIANT_SHIFT
+                if chance:
+                    h = ((tx * 73856093) ^ row_hash) & 0xFFFFFFFF
+                    h ^= h >> 16
+                    h = (h * 0x7FEB352D) & 0xFFFFFFFF
+                    h ^= h >> 15
+                    if (h & 0xFFFFFF) / 0x1000000 < chance:
+                        props[tx, ty] = (kind, tx, ty)
+        return Chunk(tiles=tiles, props=props, biomes=biomes, solid_mask=tiles.translate(_SOLID_TABLE))
 
     def get_chunk(self, cx: int, cy: int) -> Chunk:
         key = (cx, cy)
         if key not in self.chunks:
-            self.chunks[key] = self.generate_chunk(cx, cy)
+            chunk = self.chunks[key] = self.generate_chunk(cx, cy)
+            self._apply_player_blocks(chunk, cx, cy)
         return self.chunks[key]
 
+    def _apply_player_blocks(self, chunk: Chunk, cx: int, cy: int) -> None:
+        for (tx, ty), block_type in self.player_blocks.items():
+            if tx // CHUNK_SIZE == cx and ty // CHUNK_SIZE == cy:
+                idx = (ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE
+                chunk.solid_mask[idx] = block_type == "wall"
+
+    def _solid_at(self, tx: int, ty: int) -> int:
+        chunk = self.get_chunk(tx // CHUNK_SIZE, ty // CHUNK_SIZE)
+        return chunk.solid_mask[(ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE]
+
     def ensure_chunks_around(self, world_x: float, world_y: float, radius_chunks: int = 2) -> None:
-        cx = int(world_x // (TILE_SIZE * CHUNK_SIZE))
-        cy = int(world_y // (TILE_SIZE * CHUNK_SIZE))
+        cx = int(world_x // CHUNK_PX)
+        cy = int(world_y // CHUNK_PX)
         for oy in range(-radius_chunks, radius_chunks + 1):
             for ox in range(-radius_chunks, radius_chunks + 1):
                 self.get_chunk(cx + ox, cy + oy)
 
     def get_tile(self, tx: int, ty: int) -> str:
+        return TILE_NAMES[self.get_tile_id(tx, ty)]
+
+    def get_tile_id(self, tx: int, ty: int) -> int:
         cx = tx // CHUNK_SIZE
         cy = ty // CHUNK_SIZE
         lx = tx % CHUNK_SIZE
         ly = ty % CHUNK_SIZE
-        return self.get_chunk(cx, cy).tiles[ly][lx]
+        return self.get_chunk(cx, cy).tiles[ly * CHUNK_SIZE + lx] & TILE_ID_MASK
+
+    def prop_at(self, tx: int, ty: int) -> str | None:
+        """Kind of the prop standing on a tile, or None."""
+        prop = self.get_chunk(tx // CHUNK_SIZE, ty // CHUNK_SIZE).props.get((tx, ty))
+        return prop[0] if prop is not None else None
+
+    def is_discovered(self, tx: int, ty: int) -> bool:
+        bits = self.discovered_chunks.get((tx // CHUNK_SIZE, ty // CHUNK_SIZE))
+        if bits is None:
+            return False
+        idx = (ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE
+        return (bits[idx >> 3] >> (idx & 7)) & 1 == 1
+
+    def _set_discovered(self, tx: int, ty: int) -> bool:
+        """Mark a tile discovered; returns False if it already was."""
+        key = (tx // CHUNK_SIZE, ty // CHUNK_SIZE)
+        bits = self.discovered_chunks.get(key)
+        if bits is None:
+            bits = self.discovered_chunks[key] = bytearray(CHUNK_SIZE * CHUNK_SIZE // 8)
+        idx = (ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE
+        bit = 1 << (idx & 7)
+        if bits[idx >> 3] & bit:
+            return False
+        bits[idx >> 3] |= bit
+        return True
 
     def reveal_around(self, world_x: float, world_y: float, radius_tiles: int = 9) -> None:
         tx = int(world_x // TILE_SIZE)
         ty = int(world_y // TILE_SIZE)
-        for y in range(ty - radius_tiles, ty + radius_tiles + 1):
-            for x in range(tx - radius_tiles, tx + radius_tiles + 1):
-                self.discovered_tiles.add((x, y))
+        x0 = tx - radius_tiles
+        y0 = ty - radius_tiles
+        x1 = tx + radius_tiles
+        y1 = ty + radius_tiles
+        row_bytes = CHUNK_SIZE // 8
+        # Each chunk row is one little-endian CHUNK_SIZE-bit word of the bitset, so
+        # the reveal square is ORed in a row at a time per chunk it overlaps.
+        for cy in range(y0 // CHUNK_SIZE, y1 // CHUNK_SIZE + 1):
+            ly0 = max(y0 - cy * CHUNK_SIZE, 0)
+            ly1 = min(y1 - cy * CHUNK_SIZE, CHUNK_SIZE - 1)
+            for cx in range(x0 // CHUNK_SIZE, x1 // CHUNK_SIZE + 1):
+                lx0 = max(x0 - cx * CHUNK_SIZE, 0)
+                lx1 = min(x1 - cx * CHUNK_SIZE, CHUNK_SIZE - 1)
+                key = (cx, cy)
+                bits = self.discovered_chunks.get(key)
+                if bits is None:
+                    bits = self.discovered_chunks[key] = bytearray(CHUNK_SIZE * CHUNK_SIZE // 8)
+                mask = (1 << (lx1 + 1)) - (1 << lx0)
+                revealed = 0
+                for ly in range(ly0, ly1 + 1):
+                    i = ly * row_bytes
+                    old = int.from_bytes(bits[i : i + row_bytes], "little")
+                    if old & mask != mask:
+                        bits[i : i + row_bytes] = (old | mask).to_bytes(row_bytes, "little")
+                        revealed += (mask & ~old).bit_count()
+                if not revealed:
+                    continue
+                # Chunks whose mask is not built yet pick the tiles up from the bitset later.
+                chunk = self.chunks.get(key)
+                if chunk is not None and chunk.fog_mask is not None:
+                    chunk.fog_mask.fill((0, 0, 0, 0), (lx0, ly0, lx1 - lx0 + 1, ly1 - ly0 + 1))
+                    chunk.fog_left -= revealed
+                    chunk.fog = None
 
     def is_solid_tile(self, tx: int, ty: int) -> bool:
-        if (tx, ty) in self.player_blocks:
-            return self.player_blocks[(tx, ty)] == "wall"
-        tile = self.get_tile(tx, ty)
-        return tile in {"water", "stone"}
+        return self._solid_at(tx, ty) == 1
 
     def is_rect_blocked(self, rect: pygame.Rect) -> bool:
         left = rect.left // TILE_SIZE
         right = (rect.right - 1) // TILE_SIZE
         top = rect.top // TILE_SIZE
         bottom = (rect.bottom - 1) // TILE_SIZE
+        solid_at = self._solid_at
         for ty in range(top, bottom + 1):
             for tx in range(left, right + 1):
-                if self.is_solid_tile(tx, ty):
+                if solid_at(tx, ty):
                     return True
         return False
 
     def place_player_block(self, tx: int, ty: int, block_type: str = "wall") -> None:
         self.player_blocks[(tx, ty)] = block_type
+        chunk = self.chunks.get((tx // CHUNK_SIZE, ty // CHUNK_SIZE))
+        if chunk is not None:
+            chunk.solid_mask[(ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE] = block_type == "wall"
 
     def remove_player_block(self, tx: int, ty: int) -> None:
         self.player_blocks.pop((tx, ty), None)
+        chunk = self.chunks.get((tx // CHUNK_SIZE, ty // CHUNK_SIZE))
+        if chunk is not None:
+            idx = (ty % CHUNK_SIZE) * CHUNK_SIZE + tx % CHUNK_SIZE
+            chunk.solid_mask[idx] = _SOLID_TABLE[chunk.tiles[idx]]
 
     def update(self, dt: float) -> None:
         self.time_of_day = (self.time_of_day + dt * 0.28) % 24.0
@@ -373,71 +654,131 @@ class World:
         max_ty = int((camera.y + screen_h) // TILE_SIZE) + 2
 
         ambient = self._ambient_light_factor()
-        darkness_tile = self._get_dark_tile(int((1.0 - ambient) * 145))
+
+        # Screen position of world pixel (0, 0). Flooring matches world_to_screen's
+        # truncation for everything on screen, and every position below is an integer offset from it.
+        ox = math.floor(-camera.x)
+        oy = math.floor(-camera.y)
+        # Chunks whose pixel rect overlaps the screen; anything outside is rejected before it is touched.
+        chunk_xs = range(-ox // CHUNK_PX, (screen_w - 1 - ox) // CHUNK_PX + 1)
+        chunk_ys = range(-oy // CHUNK_PX, (screen_h - 1 - oy) // CHUNK_PX + 1)
+        for cy in chunk_ys:
+            for cx in chunk_xs:
+                surface.blit(self._get_chunk_surface(cx, cy), (cx * CHUNK_PX + ox, cy * CHUNK_PX + oy))
 
         for ty in range(min_ty, max_ty + 1):
+            sy = ty * TILE_SIZE + oy
             for tx in range(min_tx, max_tx + 1):
-                tile = self.get_tile(tx, ty)
-                sx, sy = camera.world_to_screen(tx * TILE_SIZE, ty * TILE_SIZE)
-                surface.blit(self._get_tile_surface(tile, tx, ty), (sx, sy))
+                sx = tx * TILE_SIZE + ox
 
-                if tile == "water":
+                if self.get_tile_id(tx, ty) == _WATER_ID:
                     wave_shift = math.sin(self.time_of_day * 1.8 + tx * 0.7 + ty * 0.35)
                     y1 = sy + 9 + int(wave_shift * 1.6)
                     y2 = sy + 20 + int(wave_shift * 1.2)
                     pygame.draw.line(surface, (175, 210, 255), (sx + 3, y1), (sx + TILE_SIZE - 4, y1), 1)
                     pygame.draw.line(surface, (126, 168, 240), (sx + 2, y2), (sx + TILE_SIZE - 2, y2), 1)
 
-                base_col = TILE_COLORS.get(tile, (120, 120, 120))
-                top_edge = self._color_shift(base_col, 10)
-                bottom_edge = self._color_shift(base_col, -16)
-                pygame.draw.line(surface, top_edge, (sx, sy), (sx + TILE_SIZE - 1, sy), 1)
-                pygame.draw.line(surface, bottom_edge, (sx, sy + TILE_SIZE - 1), (sx + TILE_SIZE - 1, sy + TILE_SIZE - 1), 1)
-
-                if ambient < 0.995:
-                    surface.blit(darkness_tile, (sx, sy))
-
-                block = self.player_blocks.get((tx, ty))
-                if block:
-                    pygame.draw.rect(surface, (186, 162, 224), (sx + 4, sy + 4, TILE_SIZE - 8, TILE_SIZE - 8), 2)
-                    pygame.draw.rect(surface, (122, 102, 162), (sx + 6, sy + 6, TILE_SIZE - 12, TILE_SIZE - 12), 1)
-
-                if (tx, ty) not in self.discovered_tiles:
-                    surface.blit(self._fog_tile, (sx, sy))
-
-        min_cx = min_tx // CHUNK_SIZE - 1
-        max_cx = max_tx // CHUNK_SIZE + 1
-        min_cy = min_ty // CHUNK_SIZE - 1
-        max_cy = max_ty // CHUNK_SIZE + 1
-        for cy in range(min_cy, max_cy + 1):
-            for cx in range(min_cx, max_cx + 1):
+        # Every tile gets the same darkness, so one screen-sized blit replaces a blit per tile.
+        if ambient < 0.995:
+            surface.blit(self._get_darkness_layer(screen_w, screen_h, int((1.0 - ambient) * 145)), (0, 0))
+
+        # Player blocks sit above the darkness, as they always have.
+        for (tx, ty), block in self.player_blocks.items():
+            if block and min_tx <= tx <= max_tx and min_ty <= ty <= max_ty:
+                sx = tx * TILE_SIZE + ox
+                sy = ty * TILE_SIZE + oy
+                pygame.draw.rect(surface, (186, 162, 224), (sx + 4, sy + 4, TILE_SIZE - 8, TILE_SIZE - 8), 2)
+                pygame.draw.rect(surface, (122, 102, 162), (sx + 6, sy + 6, TILE_SIZE - 12, TILE_SIZE - 12), 1)
+
+        for cy in chunk_ys:
+            for cx in chunk_xs:
+                fog = self._get_chunk_fog(cx, cy)
+                if fog is not None:
+                    surface.blit(fog, (cx * CHUNK_PX + ox, cy * CHUNK_PX + oy))
+
+        # Same rejection for props, with the screen grown by how far a prop can overhang its tile.
+        prop_xs = range((-ox - PROP_OVERHANG) // CHUNK_PX, (screen_w - 1 - ox + PROP_OVERHANG) // CHUNK_PX + 1)
+        prop_ys = range((-oy - PROP_OVERHANG) // CHUNK_PX, (screen_h - 1 - oy + PROP_OVERHANG) // CHUNK_PX + 1)
+        prop_ox = ox + TILE_SIZE // 2
+        prop_oy = oy + TILE_SIZE // 2
+        for cy in prop_ys:
+            for cx in prop_xs:
+                # Props are only drawn on discovered tiles, so chunks with nothing discovered are skipped.
+                if not any(self.discovered_chunks.get((cx, cy), b"")):
+                    continue
                 chunk = self.get_chunk(cx, cy)
-                for kind, tx, ty in chunk.props:
-                    if (tx, ty) not in self.discovered_tiles:
+                for kind, tx, ty in chunk.props.values():
+                    if not self.is_discovered(tx, ty):
                         continue
-                    sx, sy = camera.world_to_screen(tx * TILE_SIZE + TILE_SIZE // 2, ty * TILE_SIZE + TILE_SIZE // 2)
+                    sx = tx * TILE_SIZE + prop_ox
+                    sy = ty * TILE_SIZE + prop_oy
                     self._draw_prop(surface, kind, tx, ty, sx, sy)
 
         self._apply_local_light(surface, camera, screen_w, screen_h, ambient, focus_world)
 
+    def _packed_blocks(self) -> tuple[list[str], str]:
+        """Player blocks as (type names, base64 of little-endian int32 x, y, type index triples)."""
+        types: list[str] = []
+        type_index: dict[str, int] = {}
+        cells = array("i")
+        for (x, y), block_type in self.player_blocks.items():
+            index = type_index.get(block_type)
+            if index is None:
+                index = type_index[block_type] = len(types)
+                types.append(block_type)
+            cells.extend((x, y, index))
+        if sys.byteorder == "big":
+            cells.byteswap()
+        return types, base64.b64encode(cells.tobytes()).decode("ascii")
+
     def to_dict(self) -> dict:
+        block_types, blocks = self._packed_blocks()
         return {
             "seed": self.seed,
             "time_of_day": self.time_of_day,
             "weather": self.weather,
-            "player_blocks": {f"{x},{y}": t for (x, y), t in self.player_blocks.items()},
-            "discovered": [f"{x},{y}" for (x, y) in list(self.discovered_tiles)[:8000]],
+            "block_types": block_types,
+            "blocks": blocks,
+            # One base64 bitset per chunk with anything discovered, keyed "cx,cy".
+            "discovered_chunks": {
+                f"{cx},{cy}": base64.b64encode(bits).decode("ascii")
+                for (cx, cy), bits in self.discovered_chunks.items()
+                if any(bits)
+            },
         }
 
     def load_dict(self, data: dict) -> None:
         self.seed = data.get("seed", self.seed)
+        self._lattice_cache.clear()
         self.time_of_day = data.get("time_of_day", self.time_of_day)
         self.weather = data.get("weather", self.weather)
         self.player_blocks = {}
-        for key, value in data.get("player_blocks", {}).items():
-            x, y = key.split(",")
-            self.player_blocks[(int(x), int(y))] = value
-        self.discovered_tiles = set()
+        if "blocks" in data:
+            block_types = data.get("block_types", [])
+            cells = array("i", base64.b64decode(data["blocks"]))
+            if sys.byteorder == "big":
+                cells.byteswap()
+            for i in range(0, len(cells), 3):
+                self.player_blocks[(cells[i], cells[i + 1])] = block_types[cells[i + 2]]
+        else:
+            # Older saves: {"x,y": block_type}.
+            for key, value in data.get("player_blocks", {}).items():
+                x, y = key.split(",")
+                self.player_blocks[(int(x), int(y))] = value
+        for (cx, cy), chunk in self.chunks.items():
+            chunk.solid_mask = chunk.tiles.translate(_SOLID_TABLE)
+            self._apply_player_blocks(chunk, cx, cy)
+        self.discovered_chunks = {}
+        for chunk in self.chunks.values():
+            chunk.fog_mask = None
+            chunk.fog = None
+        bitset_size = CHUNK_SIZE * CHUNK_SIZE // 8
+        for key, encoded in data.get("discovered_chunks", {}).items():
+            bits = bytearray(base64.b64decode(encoded))
+            if len(bits) == bitset_size:
+                cx, cy = key.split(",")
+                self.discovered_chunks[(int(cx), int(cy))] = bits
+        # Older saves: a list of "x,y" tile strings.
         for p in data.get("discovered", []):
             x, y = p.split(",")
-            self.discovered_tiles.add((int(x), int(y)))
+            self._set_discovered(int(x), int(y))